@@ -0,0 +1,146 @@
+import asyncio
+import functools
+import inspect
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+
+
+class TTLCache:
+    """
+    Size-bounded in-memory cache whose entries expire after a per-entry TTL.
+
+    Least recently used entries are evicted first once maxsize is reached.
+    """
+
+    def __init__(
+        self, maxsize: int = 256, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if it is missing or expired.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Store value under key for ttl seconds.
+        """
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+tool_cache = TTLCache(maxsize=256)
+
+# Longest result, in characters, that cached_tool keeps. The cache is bounded
+# by entry count, so this caps its memory; multi-page results past it are
+# requested again instead of being held for up to a day
+MAX_CACHED_RESULT_LENGTH = 256 * 1024
+
+# Error results of requests the API rejected, so an agent retrying the same bad
+# arguments is answered locally
+error_cache = TTLCache(maxsize=256)
+
+
+class SharedCalls:
+    """
+    Lets concurrent calls with the same key share a single in-flight call.
+
+    Agents often issue the same tool call several times in parallel; only the
+    first one runs, and the others await its result. Nothing is kept once the
+    call completes, so later calls run again.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[Hashable, asyncio.Future[Any]] = {}
+
+    async def run(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await call(), or the in-flight call already running under key.
+        """
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(call())
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        # Shield the shared call so one caller being cancelled does not cancel
+        # it for the others
+        return await asyncio.shield(pending)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+def cached_tool(
+    ttl: Union[float, Callable[[dict[str, Any]], float]],
+) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """
+    Cache the CSV output of an async tool for ttl seconds.
+
+    Entries are keyed on the tool name and its bound arguments, with defaults
+    applied, so equivalent calls share an entry. Error results, and results
+    longer than MAX_CACHED_RESULT_LENGTH, are not cached.
+    ttl may also be a function of the bound arguments, for tools whose results
+    stay valid for longer depending on what they query.
+    """
+
+    def decorator(
+        fn: Callable[..., Awaitable[str]],
+    ) -> Callable[..., Awaitable[str]]:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (fn.__name__, arguments_key(bound.arguments))
+
+            cached = tool_cache.get(key)
+            if cached is not None:
+                return cached
+
+            result = await fn(**bound.arguments)
+            if result.startswith("Error:") or len(result) > MAX_CACHED_RESULT_LENGTH:
+                return result
+            lifetime = ttl(bound.arguments) if callable(ttl) else ttl
+            tool_cache.set(key, result, lifetime)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def arguments_key(arguments: dict[str, Any]) -> str:
+    """
+    Serialize tool arguments into a stable, hashable cache key.
+
+    Arguments may contain unhashable values such as lists or a params dict,
+    so they are rendered as sorted JSON instead of being hashed directly.
+    """
+    return json.dumps(arguments, sort_keys=True, default=str)
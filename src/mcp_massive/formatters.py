@@ -1,26 +1,42 @@
-import json
 import csv
 import io
-from typing import Any
+import operator
+from typing import Any, Iterator, Sequence
 
+import orjson
 
-def json_to_csv(json_input: str | dict) -> str:
+
+def json_to_csv(
+    json_input: bytes | str | dict,
+    field_formats: dict[str, str] | None = None,
+    fields: Sequence[str] | None = None,
+) -> str:
     """
     Convert JSON to flattened CSV format.
 
     Args:
-        json_input: JSON string or dict. If the JSON has a 'results' key containing
-                   a list, it will be extracted. Otherwise, the entire structure
-                   will be wrapped in a list for processing.
+        json_input: JSON bytes, string or dict. Raw response bytes are parsed
+                   directly, without decoding them to a string first. If the JSON
+                   has a 'results' key containing a list, it will be extracted.
+                   Otherwise, the entire structure will be wrapped in a list for
+                   processing.
+        field_formats: Optional mapping of flattened column name to a format
+                   spec (e.g. ".10g") applied to float values in that column,
+                   to drop digits that only add size to the output.
+        fields: Optional column order for endpoints with a known schema. Listed
+               columns come first, in this order, followed by any other columns
+               in first-seen order. Listed columns absent from every row are
+               left out.
 
     Returns:
         CSV string with headers and flattened rows
     """
-    # Parse JSON if it's a string
-    if isinstance(json_input, str):
+    # Parse JSON if it's bytes or a string
+    parsed = isinstance(json_input, (bytes, bytearray, str))
+    if parsed:
         try:
-            data = json.loads(json_input)
-        except json.JSONDecodeError:
+            data = orjson.loads(json_input)
+        except orjson.JSONDecodeError:
             # If JSON parsing fails, return empty CSV
             return ""
     else:
@@ -44,36 +60,76 @@ def json_to_csv(json_input: str | dict) -> str:
     else:
         records = [data]
 
-    # Only flatten dict records, skip non-dict items
+    # Flatten each record and collect the header in the same pass. Updating an
+    # ordered dict keeps the first-seen column order without re-scanning rows.
     flattened_records = []
+    all_keys: dict[str, Any] = {}
     for record in records:
         if isinstance(record, dict):
-            flattened_records.append(_flatten_dict(record))
+            if parsed and _is_flat(record):
+                # Rows parsed here are not shared with the caller, so flat ones
+                # are used as they are instead of being copied
+                flattened = record
+            else:
+                flattened = _flatten_dict(record)
         else:
             # If it's not a dict, wrap it in a dict with a 'value' key
-            flattened_records.append({"value": str(record)})
+            flattened = {"value": str(record)}
+        if field_formats:
+            _format_fields(flattened, field_formats)
+        all_keys.update(flattened)
+        flattened_records.append(flattened)
+
+    # Release the parsed document before the CSV text is built
+    del data, records
 
     if not flattened_records:
         return ""
 
-    # Get all unique keys across all records (for consistent column ordering)
-    all_keys = []
-    seen = set()
-    for record in flattened_records:
-        if isinstance(record, dict):
-            for key in record.keys():
-                if key not in seen:
-                    all_keys.append(key)
-                    seen.add(key)
-
+    # Project every row onto the header once, instead of letting DictWriter
+    # validate and re-map each row dict
+    if fields:
+        fieldnames = [key for key in fields if key in all_keys]
+        fieldnames.extend(key for key in all_keys if key not in fieldnames)
+    else:
+        fieldnames = list(all_keys)
     output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=all_keys, lineterminator="\n")
-    writer.writeheader()
-    writer.writerows(flattened_records)
+    writer = csv.writer(output, lineterminator="\n")
+    writer.writerow(fieldnames)
+    writer.writerows(_project_rows(flattened_records, fieldnames))
 
     return output.getvalue()
 
 
+def _project_rows(
+    records: list[dict[str, Any]], fieldnames: list[str]
+) -> Iterator[Sequence[Any]]:
+    """
+    Yield each record's values in header order, with "" for missing fields.
+
+    List endpoints return rows with a uniform schema, so a record with as many
+    keys as the header has every column and is projected with a single C-level
+    itemgetter call instead of a per-column lookup in Python.
+    """
+    width = len(fieldnames)
+    project_all = operator.itemgetter(*fieldnames) if width > 1 else None
+    for record in records:
+        if project_all is not None and len(record) == width:
+            yield project_all(record)
+        else:
+            yield [record.get(key, "") for key in fieldnames]
+
+
+def _format_fields(record: dict[str, Any], field_formats: dict[str, str]) -> None:
+    """
+    Format the float values of the given fields in place.
+    """
+    for key, spec in field_formats.items():
+        value = record.get(key)
+        if type(value) is float:
+            record[key] = format(value, spec)
+
+
 def _flatten_dict(
     d: dict[str, Any], parent_key: str = "", sep: str = "_"
 ) -> dict[str, Any]:
@@ -88,6 +144,11 @@ def _flatten_dict(
     Returns:
         Flattened dictionary with no nested structures
     """
+    if not parent_key and _is_flat(d):
+        # Already flat, as rows of most list endpoints are: copy it in C
+        # instead of rebuilding it key by key
+        return dict(d)
+
     items = []
     for k, v in d.items():
         new_key = f"{parent_key}{sep}{k}" if parent_key else k
@@ -102,3 +163,13 @@ def _flatten_dict(
             items.append((new_key, v))
 
     return dict(items)
+
+
+def _is_flat(d: dict[str, Any]) -> bool:
+    """
+    Return whether no value of d is a dict or list.
+    """
+    for v in d.values():
+        if isinstance(v, (dict, list)):
+            return False
+    return True
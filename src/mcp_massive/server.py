@@ -1,13 +1,39 @@
+import asyncio
+import functools
+import inspect
 import os
-from typing import Optional, Any, Dict, Union, List, Literal
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Optional,
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Dict,
+    Union,
+    List,
+    Literal,
+    Mapping,
+    Sequence,
+    AsyncIterator,
+)
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 from massive import RESTClient
+from massive.exceptions import AuthError, BadResponse
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError
+from urllib3.util import make_headers
 from importlib.metadata import version, PackageNotFoundError
+from urllib.parse import urlparse
 from dotenv import load_dotenv
+import orjson
+from .cache import SharedCalls, arguments_key, cached_tool, error_cache
 from .formatters import json_to_csv
 
-from datetime import datetime, date
+from datetime import datetime, date, timedelta, timezone
 
 # Load environment variables from .env file if it exists
 load_dotenv()
@@ -17,19 +43,737 @@ if not MASSIVE_API_KEY:
     print("Warning: MASSIVE_API_KEY environment variable not set.")
     print("Please set it in your environment or create a .env file with MASSIVE_API_KEY=your_key")
 
-version_number = "MCP-Massive/unknown"
-try:
-    version_number = f"MCP-Massive/{version('mcp_massive')}"
-except PackageNotFoundError:
-    pass
+# Tool calls run their requests concurrently in worker threads, so keep enough
+# idle keep-alive connections per host for them to be reused, not discarded
+MAX_CONNECTIONS = 32
+
+# Every content coding urllib3 can decode in this install, so zstd or brotli
+# are negotiated instead of gzip when their decoders are available
+ACCEPT_ENCODING = make_headers(accept_encoding=True)["accept-encoding"]
+
+# Turn on TCP keep-alive so pooled connections that sit idle between tool calls
+# are not silently dropped by NATs and load balancers, forcing a new handshake
+SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):
+    SOCKET_OPTIONS += [
+        (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60),
+        (socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 15),
+    ]
 
 massive_client = RESTClient(MASSIVE_API_KEY)
-massive_client.headers["User-Agent"] += f" {version_number}"
+massive_client.headers["Accept-Encoding"] = ACCEPT_ENCODING
+massive_client.client.connection_pool_kw.update(
+    maxsize=MAX_CONNECTIONS, socket_options=SOCKET_OPTIONS
+)
+
+# Worker threads for client requests, one per pooled connection. The default
+# executor of asyncio.to_thread is capped at os.cpu_count() + 4 threads, which
+# on small hosts would queue concurrent tool calls behind idle connections.
+request_executor = ThreadPoolExecutor(
+    max_workers=MAX_CONNECTIONS, thread_name_prefix="massive"
+)
 
 poly_mcp = FastMCP("Massive")
 
+# Failures of a request that are reported back to the model as an error string:
+# API error responses, transport errors once retries are exhausted, and
+# undecodable or invalid values. Anything else is a bug and propagates.
+REQUEST_ERRORS = (AuthError, BadResponse, HTTPError, ValueError)
+
+# Lifetimes, in seconds, of cached tool responses
+REFERENCE_DATA_TTL = 24 * 60 * 60
+DIRECTORY_TTL = 60 * 60
+MARKET_STATUS_TTL = 30
+NEWS_TTL = 60
+LIVE_DATA_TTL = 5
+HISTORICAL_DATA_TTL = 24 * 60 * 60
+# Rejected requests are remembered briefly, so a bad ticker is not re-sent on
+# every retry but a fixed upstream problem is not masked for long
+REJECTED_REQUEST_TTL = 60
+
+# Ticks are treated as final once they are this many seconds old, after late
+# reports and corrections have come in
+SETTLED_AFTER = 60 * 60
+
+# Most tickers accepted in one snapshot request; longer lists are split into
+# batches that are fetched concurrently
+TICKER_BATCH_SIZE = 250
+
+# Most per-ticker requests a fan-out tool has in flight at once, to stay clear
+# of the API's rate limits
+FAN_OUT_CONCURRENCY = 10
+
+# Most result pages a paginated tool call follows next_url for
+MAX_PAGES = 20
+
+# Aggregate bar prices keep 10 significant digits, which preserves forex and
+# crypto precision while dropping float noise from the output. Volumes are left
+# as sent since they can run past 10 digits
+AGGS_FIELD_FORMATS = {
+    "o": ".10g",
+    "h": ".10g",
+    "l": ".10g",
+    "c": ".10g",
+    "vw": ".10g",
+}
+
+# Column orders of endpoints with a fixed schema, so the CSV reads naturally
+# instead of following the key order of the JSON response
+AGGS_FIELDS = ("T", "t", "o", "h", "l", "c", "v", "vw", "n")
+TRADES_FIELDS = (
+    "sip_timestamp",
+    "participant_timestamp",
+    "price",
+    "size",
+    "exchange",
+    "conditions",
+    "id",
+    "sequence_number",
+    "tape",
+    "trf_id",
+    "trf_timestamp",
+    "correction",
+)
+QUOTES_FIELDS = (
+    "sip_timestamp",
+    "participant_timestamp",
+    "bid_price",
+    "bid_size",
+    "bid_exchange",
+    "ask_price",
+    "ask_size",
+    "ask_exchange",
+    "conditions",
+    "indicators",
+    "sequence_number",
+    "tape",
+    "trf_timestamp",
+)
+BENZINGA_EARNINGS_FIELDS = (
+    "date",
+    "time",
+    "ticker",
+    "company_name",
+    "fiscal_period",
+    "fiscal_year",
+    "date_status",
+    "importance",
+    "estimated_eps",
+    "actual_eps",
+    "eps_surprise_percent",
+    "estimated_revenue",
+    "actual_revenue",
+    "revenue_surprise_percent",
+)
+BENZINGA_GUIDANCE_FIELDS = (
+    "date",
+    "time",
+    "ticker",
+    "company_name",
+    "fiscal_period",
+    "fiscal_year",
+    "positioning",
+    "importance",
+)
+BENZINGA_NEWS_FIELDS = ("published", "title", "author", "tickers", "channels")
+BENZINGA_RATINGS_FIELDS = (
+    "date",
+    "time",
+    "ticker",
+    "company_name",
+    "firm",
+    "analyst",
+    "rating_action",
+    "previous_rating",
+    "rating",
+    "price_target_action",
+    "previous_price_target",
+    "price_target",
+    "importance",
+)
+FUTURES_AGGS_FIELDS = (
+    "ticker",
+    "window_start",
+    "session_end_date",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+)
+FUTURES_QUOTES_FIELDS = (
+    "ticker",
+    "timestamp",
+    "session_end_date",
+    "bid_price",
+    "bid_size",
+    "ask_price",
+    "ask_size",
+)
+FUTURES_TRADES_FIELDS = ("ticker", "timestamp", "session_end_date", "price", "size")
+FUTURES_CONTRACTS_FIELDS = ("ticker", "product_code", "name")
+FUTURES_SCHEDULES_FIELDS = ("product_code", "session_end_date", "trading_venue")
+FUTURES_MARKET_STATUSES_FIELDS = ("product_code", "trading_venue", "market_status")
+FUTURES_SNAPSHOT_FIELDS = ("ticker", "product_code")
+
+
+@functools.cache
+def _add_user_agent() -> None:
+    """
+    Identify this server in the client's User-Agent header, once.
+
+    Reading the installed package version touches the dist-info on disk, so it
+    is deferred from import time to the first request.
+    """
+    try:
+        version_number = f"MCP-Massive/{version('mcp_massive')}"
+    except PackageNotFoundError:
+        version_number = "MCP-Massive/unknown"
+    massive_client.headers["User-Agent"] += f" {version_number}"
+
+
+async def _call(request: Callable[..., Any], **kwargs: Any) -> Any:
+    """
+    Make a massive client request without blocking the event loop.
+
+    request is a client method with raw=True bound. The client is synchronous,
+    so the request runs in a worker thread and concurrent tool calls can
+    overlap their network round trips.
+    """
+    _add_user_agent()
+    return await _run_in_executor(request, **kwargs)
+
+
+async def _call_csv(
+    request: Callable[..., Any], arguments: Dict[str, Any], **csv_options: Any
+) -> str:
+    """
+    Make a massive client request and convert its response to CSV off the loop.
+
+    Parsing and flattening a large response is CPU-bound, so it runs alongside
+    the request instead of on the event loop, where it would stall other tool
+    calls.
+    """
+    _add_user_agent()
+
+    def call() -> str:
+        return json_to_csv(request(**arguments).data, **csv_options)
+
+    return await _run_in_executor(call)
+
+
+async def _run_in_executor(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run fn in the request worker threads and await its result.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        request_executor, functools.partial(fn, *args, **kwargs)
+    )
+
+
+async def _iter_pages(
+    request: Callable[..., Any], arguments: Dict[str, Any], max_pages: int
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield the results rows of up to max_pages pages of a list request.
+
+    Each page after the first is requested from the previous page's next_url
+    before that page is yielded, so its round trip overlaps the caller's work
+    on the current page.
+    """
+    _add_user_agent()
+    # Submit to the executor directly rather than through a task, so the next
+    # request starts right away instead of at the caller's next await
+    loop = asyncio.get_running_loop()
+    pending = loop.run_in_executor(
+        request_executor, lambda: _parse_page(request(**arguments).data)
+    )
+    for page in range(1, max_pages + 1):
+        rows, next_url = await pending
+        if next_url and page < max_pages:
+            pending = loop.run_in_executor(
+                request_executor, functools.partial(_next_page, next_url)
+            )
+        else:
+            next_url = None
+        yield rows
+        if not next_url:
+            return
+
+
+def _next_page(next_url: str) -> tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Request a next_url returned by the API, as the client does when it paginates.
+
+    Like the client, only its path and query are kept and sent to the client's
+    base URL, so the API key never goes to another host.
+    """
+    parsed = urlparse(next_url)
+    url = massive_client.BASE + parsed.path
+    if parsed.query:
+        url += "?" + parsed.query
+    response = massive_client.client.request("GET", url, headers=massive_client.headers)
+    if response.status != 200:
+        raise BadResponse(response.data.decode("utf-8"))
+    return _parse_page(response.data)
+
+
+def _parse_page(data: bytes) -> tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Return the results rows and next_url of a list response body.
+    """
+    body = orjson.loads(data)
+    rows = body.get("results")
+    return (rows if isinstance(rows, list) else []), body.get("next_url")
+
+
+async def _call_batched(
+    request: Callable[..., Any], arguments: Dict[str, Any], batch_param: str
+) -> Dict[str, Any]:
+    """
+    Fetch a long ticker list in concurrent batches and merge the responses.
+
+    List values, such as the results or tickers rows, are concatenated in batch
+    order and cut to the requested limit, which each batch applies on its own.
+    count is recomputed from the merged rows; next_url and request_id, which
+    only describe one batch's request, are dropped; other fields are taken from
+    the first response.
+    """
+    tickers = arguments[batch_param]
+    batches = [
+        tickers[i : i + TICKER_BATCH_SIZE]
+        for i in range(0, len(tickers), TICKER_BATCH_SIZE)
+    ]
+    # The client writes each batch's query into the params dict it is given,
+    # from its worker thread, so every batch needs a dict of its own
+    params = arguments.get("params")
+    batch_arguments = [
+        {**arguments, batch_param: batch}
+        if params is None
+        else {**arguments, batch_param: batch, "params": dict(params)}
+        for batch in batches
+    ]
+    responses = await asyncio.gather(
+        *(_call(request, **kwargs) for kwargs in batch_arguments)
+    )
+
+    merged: Dict[str, Any] = {}
+    for response in responses:
+        for key, value in orjson.loads(response.data).items():
+            if isinstance(value, list):
+                merged.setdefault(key, []).extend(value)
+            else:
+                merged.setdefault(key, value)
+    merged.pop("next_url", None)
+    merged.pop("request_id", None)
+
+    limit = arguments.get("limit")
+    rows = [key for key, value in merged.items() if isinstance(value, list)]
+    if limit:
+        for key in rows:
+            del merged[key][limit:]
+    if "count" in merged:
+        merged["count"] = max((len(merged[key]) for key in rows), default=0)
+    return merged
+
+
+def _futures_ticks_ttl(arguments: Dict[str, Any]) -> float:
+    """
+    Cache lifetime of a futures trades or quotes query.
+
+    A query bounded above by a time that has already settled returns the same
+    rows every time, so it is kept for long; one reaching up to now is not.
+    """
+    for name in (
+        "timestamp",
+        "timestamp_lt",
+        "timestamp_lte",
+        "session_end_date",
+        "session_end_date_lt",
+        "session_end_date_lte",
+    ):
+        value = arguments.get(name)
+        if isinstance(value, str) and _is_settled(value):
+            return HISTORICAL_DATA_TTL
+    return LIVE_DATA_TTL
+
+
+def _is_settled(value: str) -> bool:
+    """
+    Return whether a date, ISO timestamp or epoch timestamp is settled.
+
+    Epoch timestamps may be in seconds up to nanoseconds. A date covers the
+    whole day, so it is settled once the following day is.
+    """
+    if value.isdigit():
+        seconds = float(value)
+        while seconds > 1e11:
+            seconds /= 1000
+    else:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return False
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        if len(value) == len("yyyy-mm-dd"):
+            parsed += timedelta(days=1)
+        seconds = parsed.timestamp()
+    return seconds < time.time() - SETTLED_AFTER
+
+
+def _massive_tool(
+    method: Callable[..., Any],
+    field_formats: Optional[Dict[str, str]] = None,
+    fields: Optional[Sequence[str]] = None,
+    batch_param: Optional[str] = None,
+    pages_param: Optional[str] = None,
+) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """
+    Implement a tool by forwarding its arguments to a massive client method.
+
+    The decorated function only declares the tool: its name, signature and
+    docstring become the MCP tool schema, and its body is never run. Arguments
+    the client method does not accept are not forwarded. field_formats and
+    fields are passed to json_to_csv to shorten float columns and to order the
+    columns of the output. A ticker list passed as batch_param that is longer
+    than TICKER_BATCH_SIZE is split into batches that are requested
+    concurrently. The tool parameter named by pages_param sets how many result
+    pages, up to MAX_PAGES, are fetched and returned as one CSV.
+
+    Concurrent calls with identical arguments share one request, and calls
+    that cannot return rows (limit=0, or an empty range filter) return without
+    one. The API's rejection of a request is returned again for identical calls
+    for REJECTED_REQUEST_TTL seconds; network errors are not remembered.
+    """
+    accepted = _accepted_parameters(method)
+    # Bind raw=True once: tools convert the raw JSON body instead of letting the
+    # client build model objects
+    request = functools.partial(method, raw=True)
+
+    def decorator(
+        fn: Callable[..., Awaitable[str]],
+    ) -> Callable[..., Awaitable[str]]:
+        signature = inspect.signature(fn)
+        bind = _argument_binder(signature, accepted, keep={pages_param})
+        bounds = _range_bounds(signature.parameters)
+        shared = SharedCalls()
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            arguments = bind(args, kwargs)
+            skipped = _skipped_result(arguments, bounds)
+            if skipped is not None:
+                return skipped
+            key = arguments_key(arguments)
+            rejected = error_cache.get((fn.__name__, key))
+            if rejected is not None:
+                return rejected
+            return await shared.run(key, functools.partial(fetch, key, arguments))
+
+        async def fetch(key: str, arguments: Dict[str, Any]) -> str:
+            pages = 1
+            if pages_param:
+                arguments = dict(arguments)
+                pages = min(arguments.pop(pages_param) or 1, MAX_PAGES)
+            try:
+                if pages > 1:
+                    rows = [
+                        row
+                        async for page in _iter_pages(request, arguments, pages)
+                        for row in page
+                    ]
+                    return await _run_in_executor(
+                        json_to_csv, rows, field_formats=field_formats, fields=fields
+                    )
+                tickers = arguments.get(batch_param) if batch_param else None
+                if isinstance(tickers, list) and len(tickers) > TICKER_BATCH_SIZE:
+                    data = await _call_batched(request, arguments, batch_param)
+                    return await _run_in_executor(
+                        json_to_csv, data, field_formats=field_formats, fields=fields
+                    )
+                return await _call_csv(
+                    request, arguments, field_formats=field_formats, fields=fields
+                )
+            except REQUEST_ERRORS as e:
+                return _error_result(fn.__name__, key, e)
+
+        return wrapper
+
+    return decorator
+
+
+def _argument_binder(
+    signature: inspect.Signature,
+    accepted: Optional[frozenset[str]],
+    keep: Collection[Optional[str]] = (),
+) -> Callable[[tuple[Any, ...], Dict[str, Any]], Dict[str, Any]]:
+    """
+    Return a function turning a tool call's arguments into client arguments.
+
+    Defaults and the forwarded parameter names are resolved once, here, so a
+    call merges dicts instead of binding the signature. MCP passes tool
+    arguments by keyword; positional calls still go through Signature.bind.
+    Parameters the client method does not accept are dropped, except those in
+    keep, which the tool handles itself.
+
+    Tools take *_any_of filters as comma-separated strings, but the client
+    joins them with commas itself, so a string would be sent one character per
+    item; they are split into lists here.
+    """
+    dropped = frozenset(
+        name
+        for name in signature.parameters
+        if accepted is not None and name not in accepted and name not in keep
+    )
+    defaults = {
+        name: parameter.default
+        for name, parameter in signature.parameters.items()
+        if name not in dropped and parameter.default is not parameter.empty
+    }
+    any_of = frozenset(
+        name
+        for name in signature.parameters
+        if name.endswith("_any_of") and name not in dropped
+    )
+
+    def bind(args: tuple[Any, ...], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        if args:
+            kwargs = signature.bind(*args, **kwargs).arguments
+        arguments = {**defaults, **kwargs}
+        if dropped:
+            for name in dropped.intersection(kwargs):
+                del arguments[name]
+        for name in any_of.intersection(kwargs):
+            if isinstance(arguments[name], str):
+                arguments[name] = arguments[name].split(",")
+        _drop_none_params(arguments)
+        return arguments
+
+    return bind
+
+
+def _skipped_result(
+    arguments: Dict[str, Any], bounds: List[tuple[str, str, bool]]
+) -> Optional[str]:
+    """
+    Return the result of a call that cannot return rows, so it is not made.
+
+    That is an empty CSV for limit=0, or an error for an empty range filter.
+    """
+    if arguments.get("limit") == 0:
+        return ""
+    empty_range = _empty_range(arguments, bounds)
+    if empty_range:
+        return f"Error: empty range, {empty_range}"
+    return None
+
+
+def _error_result(tool: str, key: str, error: Exception) -> str:
+    """
+    Return the error string of a failed request.
+
+    urllib3 retries rate limits and server errors, so a BadResponse surfacing
+    here is the API rejecting these arguments, and its error is returned again
+    for the same tool and arguments for REJECTED_REQUEST_TTL seconds.
+    """
+    message = f"Error: {_error_message(error)}"
+    if isinstance(error, BadResponse):
+        error_cache.set((tool, key), message, REJECTED_REQUEST_TTL)
+    return message
+
+
+def _drop_none_params(arguments: Dict[str, Any]) -> None:
+    """
+    Replace the params passthrough dict with a copy without None values.
+
+    The client leaves None arguments out of the query, but merges params into
+    it as given, so a None there would be sent as the string "None" and make
+    otherwise identical requests differ. The client also adds the query to the
+    params dict it receives, so a copy keeps the caller's dict unchanged.
+    """
+    params = arguments.get("params")
+    if params is not None:
+        arguments["params"] = {
+            name: value for name, value in params.items() if value is not None
+        }
+
+
+def _range_bounds(
+    parameters: Mapping[str, inspect.Parameter],
+) -> List[tuple[str, str, bool]]:
+    """
+    Pair up the lower and upper bound filters declared for the same field.
+
+    parameters are a tool's signature parameters, keyed by name.
+
+    Returns (lower, upper, inclusive) tuples, where inclusive is True only for
+    a _gte/_lte pair, which still matches rows when both bounds are equal.
+    """
+    bounds = []
+    for lower in parameters:
+        for lower_suffix in ("_gt", "_gte"):
+            if not lower.endswith(lower_suffix):
+                continue
+            field = lower[: -len(lower_suffix)]
+            for upper_suffix in ("_lt", "_lte"):
+                upper = field + upper_suffix
+                if upper in parameters:
+                    inclusive = lower_suffix == "_gte" and upper_suffix == "_lte"
+                    bounds.append((lower, upper, inclusive))
+    return bounds
+
+
+def _empty_range(
+    arguments: Dict[str, Any], bounds: List[tuple[str, str, bool]]
+) -> Optional[str]:
+    """
+    Describe the first range filter that no row can match, if any.
+
+    Bounds are only compared when they have the same type. Strings are only
+    compared when they have the same length and the same text past the seconds
+    of an ISO timestamp, since e.g. a date and an epoch timestamp, or times in
+    different UTC offsets, do not order meaningfully as text. A datetime with
+    a UTC offset and one without cannot be compared at all.
+    """
+    for lower, upper, inclusive in bounds:
+        low, high = arguments.get(lower), arguments.get(upper)
+        if (
+            type(low) is not type(high)
+            or not isinstance(low, (int, float, str, date))
+            or (isinstance(low, str) and (len(low), low[19:]) != (len(high), high[19:]))
+            or (
+                isinstance(low, datetime)
+                and (low.utcoffset() is None) != (high.utcoffset() is None)
+            )
+        ):
+            continue
+        if low > high or (low == high and not inclusive):
+            return f"{lower}={low} is not below {upper}={high}"
+    return None
+
+
+def _error_message(error: Exception) -> str:
+    """
+    Describe a request error in one line.
+
+    BadResponse carries the raw JSON body of the error response, so its
+    message or error field is returned instead of the whole document.
+    """
+    if isinstance(error, BadResponse):
+        try:
+            body = orjson.loads(str(error))
+        except orjson.JSONDecodeError:
+            return str(error)
+        if isinstance(body, dict):
+            message = body.get("message") or body.get("error")
+            if message:
+                return str(message)
+    return str(error)
+
+
+def _accepted_parameters(method: Callable[..., Any]) -> Optional[frozenset[str]]:
+    """
+    Return the keyword arguments method accepts, or None if it takes **kwargs.
+    """
+    parameters = inspect.signature(method).parameters
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in parameters.values()):
+        return None
+    return frozenset(parameters)
+
+
+def _massive_fan_out_tool(
+    method: Callable[..., Any], fields: Optional[Sequence[str]] = None
+) -> Callable[[Callable[..., Awaitable[str]]], Callable[..., Awaitable[str]]]:
+    """
+    Implement a tool that calls a single-ticker massive client method for a
+    list of tickers.
+
+    The decorated function declares a tickers list and the filters shared by
+    every ticker. One request per distinct ticker is made concurrently, at most
+    FAN_OUT_CONCURRENCY at a time, and the results rows of all responses are
+    returned as a single CSV, with a ticker column added where rows lack one.
+    A ticker whose request fails does not discard the others' rows: it is
+    reported on an "Error: <ticker>: <message>" line ahead of the CSV.
+
+    Arguments are forwarded, and calls without rows skipped, as in
+    _massive_tool. Each ticker's request is shared with concurrent identical
+    ones, and its rejection remembered, as a _massive_tool call would be.
+    """
+    accepted = _accepted_parameters(method)
+    request = functools.partial(method, raw=True)
+
+    def decorator(
+        fn: Callable[..., Awaitable[str]],
+    ) -> Callable[..., Awaitable[str]]:
+        signature = inspect.signature(fn)
+        bind = _argument_binder(signature, accepted, keep={"tickers"})
+        bounds = _range_bounds(signature.parameters)
+        shared = SharedCalls()
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> str:
+            arguments = bind(args, kwargs)
+            skipped = _skipped_result(arguments, bounds)
+            if skipped is not None:
+                return skipped
+            tickers = list(dict.fromkeys(arguments.pop("tickers")))
+            semaphore = asyncio.Semaphore(FAN_OUT_CONCURRENCY)
+
+            async def fetch_ticker(ticker: str) -> Union[List[Dict[str, Any]], str]:
+                ticker_arguments = {**arguments, "ticker": ticker}
+                key = arguments_key(ticker_arguments)
+                rejected = error_cache.get((fn.__name__, key))
+                if rejected is not None:
+                    return rejected
+                call = functools.partial(_run_in_executor, fetch, ticker_arguments)
+                async with semaphore:
+                    try:
+                        return await shared.run(key, call)
+                    except REQUEST_ERRORS as e:
+                        return _error_result(fn.__name__, key, e)
+
+            _add_user_agent()
+            # Collect every outcome so one ticker's failure neither discards
+            # the others' rows nor leaves their requests running unobserved
+            results = await asyncio.gather(
+                *map(fetch_ticker, tickers), return_exceptions=True
+            )
+            errors = []
+            rows = []
+            for ticker, result in zip(tickers, results):
+                if isinstance(result, BaseException):
+                    raise result
+                if isinstance(result, str):
+                    message = result.removeprefix("Error: ")
+                    errors.append(f"Error: {ticker}: {message}\n")
+                else:
+                    rows.extend(result)
+            if not rows:
+                return "".join(errors)
+            output = await _run_in_executor(json_to_csv, rows, fields=fields)
+            return "".join(errors) + output
+
+        def fetch(arguments: Dict[str, Any]) -> List[Dict[str, Any]]:
+            rows = orjson.loads(request(**arguments).data).get("results")
+            if not isinstance(rows, list):
+                return []
+            for row in rows:
+                row.setdefault("ticker", arguments["ticker"])
+            return rows
+
+        return wrapper
+
+    return decorator
+
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(
+    massive_client.get_aggs, field_formats=AGGS_FIELD_FORMATS, fields=AGGS_FIELDS
+)
 async def get_aggs(
     ticker: str,
     multiplier: int,
@@ -44,27 +788,12 @@ async def get_aggs(
     """
     List aggregate bars for a ticker over a given date range in custom time window sizes.
     """
-    try:
-        results = massive_client.get_aggs(
-            ticker=ticker,
-            multiplier=multiplier,
-            timespan=timespan,
-            from_=from_,
-            to=to,
-            adjusted=adjusted,
-            sort=sort,
-            limit=limit,
-            params=params,
-            raw=True,
-        )
-
-        # Parse the binary data to string and then to JSON
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(
+    massive_client.list_aggs, field_formats=AGGS_FIELD_FORMATS, fields=AGGS_FIELDS
+)
 async def list_aggs(
     ticker: str,
     multiplier: int,
@@ -79,26 +808,14 @@ async def list_aggs(
     """
     Iterate through aggregate bars for a ticker over a given date range.
     """
-    try:
-        results = massive_client.list_aggs(
-            ticker=ticker,
-            multiplier=multiplier,
-            timespan=timespan,
-            from_=from_,
-            to=to,
-            adjusted=adjusted,
-            sort=sort,
-            limit=limit,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(
+    massive_client.get_grouped_daily_aggs,
+    field_formats=AGGS_FIELD_FORMATS,
+    fields=AGGS_FIELDS,
+)
 async def get_grouped_daily_aggs(
     date: str,
     adjusted: Optional[bool] = None,
@@ -110,23 +827,10 @@ async def get_grouped_daily_aggs(
     """
     Get grouped daily bars for entire market for a specific date.
     """
-    try:
-        results = massive_client.get_grouped_daily_aggs(
-            date=date,
-            adjusted=adjusted,
-            include_otc=include_otc,
-            locale=locale,
-            market_type=market_type,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_daily_open_close_agg)
 async def get_daily_open_close_agg(
     ticker: str,
     date: str,
@@ -136,17 +840,14 @@ async def get_daily_open_close_agg(
     """
     Get daily open, close, high, and low for a specific ticker and date.
     """
-    try:
-        results = massive_client.get_daily_open_close_agg(
-            ticker=ticker, date=date, adjusted=adjusted, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(
+    massive_client.get_previous_close_agg,
+    field_formats=AGGS_FIELD_FORMATS,
+    fields=AGGS_FIELDS,
+)
 async def get_previous_close_agg(
     ticker: str,
     adjusted: Optional[bool] = None,
@@ -155,17 +856,10 @@ async def get_previous_close_agg(
     """
     Get previous day's open, close, high, and low for a specific ticker.
     """
-    try:
-        results = massive_client.get_previous_close_agg(
-            ticker=ticker, adjusted=adjusted, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_trades, fields=TRADES_FIELDS)
 async def list_trades(
     ticker: str,
     timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -181,41 +875,20 @@ async def list_trades(
     """
     Get trades for a ticker symbol.
     """
-    try:
-        results = massive_client.list_trades(
-            ticker=ticker,
-            timestamp=timestamp,
-            timestamp_lt=timestamp_lt,
-            timestamp_lte=timestamp_lte,
-            timestamp_gt=timestamp_gt,
-            timestamp_gte=timestamp_gte,
-            limit=limit,
-            sort=sort,
-            order=order,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_last_trade)
 async def get_last_trade(
     ticker: str,
 ) -> str:
     """
     Get the most recent trade for a ticker symbol.
     """
-    try:
-        results = massive_client.get_last_trade(ticker=ticker, raw=True)
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_last_crypto_trade)
 async def get_last_crypto_trade(
     from_: str,
     to: str,
@@ -224,17 +897,10 @@ async def get_last_crypto_trade(
     """
     Get the most recent trade for a crypto pair.
     """
-    try:
-        results = massive_client.get_last_crypto_trade(
-            from_=from_, to=to, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_quotes, fields=QUOTES_FIELDS)
 async def list_quotes(
     ticker: str,
     timestamp: Optional[Union[str, int, datetime, date]] = None,
@@ -250,27 +916,10 @@ async def list_quotes(
     """
     Get quotes for a ticker symbol.
     """
-    try:
-        results = massive_client.list_quotes(
-            ticker=ticker,
-            timestamp=timestamp,
-            timestamp_lt=timestamp_lt,
-            timestamp_lte=timestamp_lte,
-            timestamp_gt=timestamp_gt,
-            timestamp_gte=timestamp_gte,
-            limit=limit,
-            sort=sort,
-            order=order,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_last_quote)
 async def get_last_quote(
     ticker: str,
     params: Optional[Dict[str, Any]] = None,
@@ -278,15 +927,10 @@ async def get_last_quote(
     """
     Get the most recent quote for a ticker symbol.
     """
-    try:
-        results = massive_client.get_last_quote(ticker=ticker, params=params, raw=True)
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_last_forex_quote)
 async def get_last_forex_quote(
     from_: str,
     to: str,
@@ -295,17 +939,10 @@ async def get_last_forex_quote(
     """
     Get the most recent forex quote.
     """
-    try:
-        results = massive_client.get_last_forex_quote(
-            from_=from_, to=to, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_real_time_currency_conversion)
 async def get_real_time_currency_conversion(
     from_: str,
     to: str,
@@ -316,22 +953,10 @@ async def get_real_time_currency_conversion(
     """
     Get real-time currency conversion.
     """
-    try:
-        results = massive_client.get_real_time_currency_conversion(
-            from_=from_,
-            to=to,
-            amount=amount,
-            precision=precision,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_universal_snapshots, batch_param="ticker_any_of")
 async def list_universal_snapshots(
     type: str,
     ticker_any_of: Optional[List[str]] = None,
@@ -343,23 +968,10 @@ async def list_universal_snapshots(
     """
     Get universal snapshots for multiple assets of a specific type.
     """
-    try:
-        results = massive_client.list_universal_snapshots(
-            type=type,
-            ticker_any_of=ticker_any_of,
-            order=order,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_snapshot_all, batch_param="tickers")
 async def get_snapshot_all(
     market_type: str,
     tickers: Optional[List[str]] = None,
@@ -369,21 +981,10 @@ async def get_snapshot_all(
     """
     Get a snapshot of all tickers in a market.
     """
-    try:
-        results = massive_client.get_snapshot_all(
-            market_type=market_type,
-            tickers=tickers,
-            include_otc=include_otc,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_snapshot_direction)
 async def get_snapshot_direction(
     market_type: str,
     direction: str,
@@ -393,21 +994,10 @@ async def get_snapshot_direction(
     """
     Get gainers or losers for a market.
     """
-    try:
-        results = massive_client.get_snapshot_direction(
-            market_type=market_type,
-            direction=direction,
-            include_otc=include_otc,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_snapshot_ticker)
 async def get_snapshot_ticker(
     market_type: str,
     ticker: str,
@@ -416,17 +1006,10 @@ async def get_snapshot_ticker(
     """
     Get snapshot for a specific ticker.
     """
-    try:
-        results = massive_client.get_snapshot_ticker(
-            market_type=market_type, ticker=ticker, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_snapshot_option)
 async def get_snapshot_option(
     underlying_asset: str,
     option_contract: str,
@@ -435,20 +1018,10 @@ async def get_snapshot_option(
     """
     Get snapshot for a specific option contract.
     """
-    try:
-        results = massive_client.get_snapshot_option(
-            underlying_asset=underlying_asset,
-            option_contract=option_contract,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_snapshot_crypto_book)
 async def get_snapshot_crypto_book(
     ticker: str,
     params: Optional[Dict[str, Any]] = None,
@@ -456,47 +1029,32 @@ async def get_snapshot_crypto_book(
     """
     Get snapshot for a crypto ticker's order book.
     """
-    try:
-        results = massive_client.get_snapshot_crypto_book(
-            ticker=ticker, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=REFERENCE_DATA_TTL)
+@_massive_tool(massive_client.get_market_holidays)
 async def get_market_holidays(
     params: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Get upcoming market holidays and their open/close times.
     """
-    try:
-        results = massive_client.get_market_holidays(params=params, raw=True)
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=MARKET_STATUS_TTL)
+@_massive_tool(massive_client.get_market_status)
 async def get_market_status(
     params: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Get current trading status of exchanges and financial markets.
     """
-    try:
-        results = massive_client.get_market_status(params=params, raw=True)
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_tickers)
 async def list_tickers(
     ticker: Optional[str] = None,
     type: Optional[str] = None,
@@ -515,30 +1073,10 @@ async def list_tickers(
     """
     Query supported ticker symbols across stocks, indices, forex, and crypto.
     """
-    try:
-        results = massive_client.list_tickers(
-            ticker=ticker,
-            type=type,
-            market=market,
-            exchange=exchange,
-            cusip=cusip,
-            cik=cik,
-            date=date,
-            search=search,
-            active=active,
-            sort=sort,
-            order=order,
-            limit=limit,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.get_ticker_details)
 async def get_ticker_details(
     ticker: str,
     date: Optional[Union[str, datetime, date]] = None,
@@ -547,17 +1085,10 @@ async def get_ticker_details(
     """
     Get detailed information about a specific ticker.
     """
-    try:
-        results = massive_client.get_ticker_details(
-            ticker=ticker, date=date, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_ticker_news)
 async def list_ticker_news(
     ticker: Optional[str] = None,
     published_utc: Optional[Union[str, datetime, date]] = None,
@@ -569,23 +1100,11 @@ async def list_ticker_news(
     """
     Get recent news articles for a stock ticker.
     """
-    try:
-        results = massive_client.list_ticker_news(
-            ticker=ticker,
-            published_utc=published_utc,
-            limit=limit,
-            sort=sort,
-            order=order,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=REFERENCE_DATA_TTL)
+@_massive_tool(massive_client.get_ticker_types)
 async def get_ticker_types(
     asset_class: Optional[str] = None,
     locale: Optional[str] = None,
@@ -594,17 +1113,10 @@ async def get_ticker_types(
     """
     List all ticker types supported by Massive.com.
     """
-    try:
-        results = massive_client.get_ticker_types(
-            asset_class=asset_class, locale=locale, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_splits)
 async def list_splits(
     ticker: Optional[str] = None,
     execution_date: Optional[Union[str, datetime, date]] = None,
@@ -615,22 +1127,10 @@ async def list_splits(
     """
     Get historical stock splits.
     """
-    try:
-        results = massive_client.list_splits(
-            ticker=ticker,
-            execution_date=execution_date,
-            reverse_split=reverse_split,
-            limit=limit,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_dividends)
 async def list_dividends(
     ticker: Optional[str] = None,
     ex_dividend_date: Optional[Union[str, datetime, date]] = None,
@@ -642,23 +1142,11 @@ async def list_dividends(
     """
     Get historical cash dividends.
     """
-    try:
-        results = massive_client.list_dividends(
-            ticker=ticker,
-            ex_dividend_date=ex_dividend_date,
-            frequency=frequency,
-            dividend_type=dividend_type,
-            limit=limit,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=REFERENCE_DATA_TTL)
+@_massive_tool(massive_client.list_conditions)
 async def list_conditions(
     asset_class: Optional[str] = None,
     data_type: Optional[str] = None,
@@ -669,22 +1157,11 @@ async def list_conditions(
     """
     List conditions used by Massive.com.
     """
-    try:
-        results = massive_client.list_conditions(
-            asset_class=asset_class,
-            data_type=data_type,
-            id=id,
-            sip=sip,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=REFERENCE_DATA_TTL)
+@_massive_tool(massive_client.get_exchanges)
 async def get_exchanges(
     asset_class: Optional[str] = None,
     locale: Optional[str] = None,
@@ -693,17 +1170,10 @@ async def get_exchanges(
     """
     List exchanges known by Massive.com.
     """
-    try:
-        results = massive_client.get_exchanges(
-            asset_class=asset_class, locale=locale, params=params, raw=True
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.vx.list_stock_financials)
 async def list_stock_financials(
     ticker: Optional[str] = None,
     cik: Optional[str] = None,
@@ -730,38 +1200,10 @@ async def list_stock_financials(
     """
     Get fundamental financial data for companies.
     """
-    try:
-        results = massive_client.vx.list_stock_financials(
-            ticker=ticker,
-            cik=cik,
-            company_name=company_name,
-            company_name_search=company_name_search,
-            sic=sic,
-            filing_date=filing_date,
-            filing_date_lt=filing_date_lt,
-            filing_date_lte=filing_date_lte,
-            filing_date_gt=filing_date_gt,
-            filing_date_gte=filing_date_gte,
-            period_of_report_date=period_of_report_date,
-            period_of_report_date_lt=period_of_report_date_lt,
-            period_of_report_date_lte=period_of_report_date_lte,
-            period_of_report_date_gt=period_of_report_date_gt,
-            period_of_report_date_gte=period_of_report_date_gte,
-            timeframe=timeframe,
-            include_sources=include_sources,
-            limit=limit,
-            sort=sort,
-            order=order,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.vx.list_ipos)
 async def list_ipos(
     ticker: Optional[str] = None,
     listing_date: Optional[Union[str, datetime, date]] = None,
@@ -778,28 +1220,10 @@ async def list_ipos(
     """
     Retrieve upcoming or historical IPOs.
     """
-    try:
-        results = massive_client.vx.list_ipos(
-            ticker=ticker,
-            listing_date=listing_date,
-            listing_date_lt=listing_date_lt,
-            listing_date_lte=listing_date_lte,
-            listing_date_gt=listing_date_gt,
-            listing_date_gte=listing_date_gte,
-            ipo_status=ipo_status,
-            limit=limit,
-            sort=sort,
-            order=order,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_short_interest)
 async def list_short_interest(
     ticker: Optional[str] = None,
     settlement_date: Optional[Union[str, datetime, date]] = None,
@@ -815,27 +1239,10 @@ async def list_short_interest(
     """
     Retrieve short interest data for stocks.
     """
-    try:
-        results = massive_client.list_short_interest(
-            ticker=ticker,
-            settlement_date=settlement_date,
-            settlement_date_lt=settlement_date_lt,
-            settlement_date_lte=settlement_date_lte,
-            settlement_date_gt=settlement_date_gt,
-            settlement_date_gte=settlement_date_gte,
-            limit=limit,
-            sort=sort,
-            order=order,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_short_volume)
 async def list_short_volume(
     ticker: Optional[str] = None,
     date: Optional[Union[str, datetime, date]] = None,
@@ -851,27 +1258,10 @@ async def list_short_volume(
     """
     Retrieve short volume data for stocks.
     """
-    try:
-        results = massive_client.list_short_volume(
-            ticker=ticker,
-            date=date,
-            date_lt=date_lt,
-            date_lte=date_lte,
-            date_gt=date_gt,
-            date_gte=date_gte,
-            limit=limit,
-            sort=sort,
-            order=order,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_treasury_yields)
 async def list_treasury_yields(
     date: Optional[Union[str, datetime, date]] = None,
     date_any_of: Optional[str] = None,
@@ -887,26 +1277,10 @@ async def list_treasury_yields(
     """
     Retrieve treasury yield data.
     """
-    try:
-        results = massive_client.list_treasury_yields(
-            date=date,
-            date_lt=date_lt,
-            date_lte=date_lte,
-            date_gt=date_gt,
-            date_gte=date_gte,
-            limit=limit,
-            sort=sort,
-            order=order,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_inflation)
 async def list_inflation(
     date: Optional[Union[str, datetime, date]] = None,
     date_any_of: Optional[str] = None,
@@ -921,26 +1295,10 @@ async def list_inflation(
     """
     Get inflation data from the Federal Reserve.
     """
-    try:
-        results = massive_client.list_inflation(
-            date=date,
-            date_any_of=date_any_of,
-            date_gt=date_gt,
-            date_gte=date_gte,
-            date_lt=date_lt,
-            date_lte=date_lte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_benzinga_analyst_insights)
 async def list_benzinga_analyst_insights(
     date: Optional[Union[str, date]] = None,
     date_any_of: Optional[str] = None,
@@ -991,62 +1349,11 @@ async def list_benzinga_analyst_insights(
     """
     List Benzinga analyst insights.
     """
-    try:
-        results = massive_client.list_benzinga_analyst_insights(
-            date=date,
-            date_any_of=date_any_of,
-            date_gt=date_gt,
-            date_gte=date_gte,
-            date_lt=date_lt,
-            date_lte=date_lte,
-            ticker=ticker,
-            ticker_any_of=ticker_any_of,
-            ticker_gt=ticker_gt,
-            ticker_gte=ticker_gte,
-            ticker_lt=ticker_lt,
-            ticker_lte=ticker_lte,
-            last_updated=last_updated,
-            last_updated_any_of=last_updated_any_of,
-            last_updated_gt=last_updated_gt,
-            last_updated_gte=last_updated_gte,
-            last_updated_lt=last_updated_lt,
-            last_updated_lte=last_updated_lte,
-            firm=firm,
-            firm_any_of=firm_any_of,
-            firm_gt=firm_gt,
-            firm_gte=firm_gte,
-            firm_lt=firm_lt,
-            firm_lte=firm_lte,
-            rating_action=rating_action,
-            rating_action_any_of=rating_action_any_of,
-            rating_action_gt=rating_action_gt,
-            rating_action_gte=rating_action_gte,
-            rating_action_lt=rating_action_lt,
-            rating_action_lte=rating_action_lte,
-            benzinga_firm_id=benzinga_firm_id,
-            benzinga_firm_id_any_of=benzinga_firm_id_any_of,
-            benzinga_firm_id_gt=benzinga_firm_id_gt,
-            benzinga_firm_id_gte=benzinga_firm_id_gte,
-            benzinga_firm_id_lt=benzinga_firm_id_lt,
-            benzinga_firm_id_lte=benzinga_firm_id_lte,
-            benzinga_rating_id=benzinga_rating_id,
-            benzinga_rating_id_any_of=benzinga_rating_id_any_of,
-            benzinga_rating_id_gt=benzinga_rating_id_gt,
-            benzinga_rating_id_gte=benzinga_rating_id_gte,
-            benzinga_rating_id_lt=benzinga_rating_id_lt,
-            benzinga_rating_id_lte=benzinga_rating_id_lte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=DIRECTORY_TTL)
+@_massive_tool(massive_client.list_benzinga_analysts)
 async def list_benzinga_analysts(
     benzinga_id: Optional[str] = None,
     benzinga_id_any_of: Optional[str] = None,
@@ -1079,44 +1386,10 @@ async def list_benzinga_analysts(
     """
     List Benzinga analysts.
     """
-    try:
-        results = massive_client.list_benzinga_analysts(
-            benzinga_id=benzinga_id,
-            benzinga_id_any_of=benzinga_id_any_of,
-            benzinga_id_gt=benzinga_id_gt,
-            benzinga_id_gte=benzinga_id_gte,
-            benzinga_id_lt=benzinga_id_lt,
-            benzinga_id_lte=benzinga_id_lte,
-            benzinga_firm_id=benzinga_firm_id,
-            benzinga_firm_id_any_of=benzinga_firm_id_any_of,
-            benzinga_firm_id_gt=benzinga_firm_id_gt,
-            benzinga_firm_id_gte=benzinga_firm_id_gte,
-            benzinga_firm_id_lt=benzinga_firm_id_lt,
-            benzinga_firm_id_lte=benzinga_firm_id_lte,
-            firm_name=firm_name,
-            firm_name_any_of=firm_name_any_of,
-            firm_name_gt=firm_name_gt,
-            firm_name_gte=firm_name_gte,
-            firm_name_lt=firm_name_lt,
-            firm_name_lte=firm_name_lte,
-            full_name=full_name,
-            full_name_any_of=full_name_any_of,
-            full_name_gt=full_name_gt,
-            full_name_gte=full_name_gte,
-            full_name_lt=full_name_lt,
-            full_name_lte=full_name_lte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_benzinga_consensus_ratings)
 async def list_benzinga_consensus_ratings(
     ticker: str,
     date: Optional[Union[str, date]] = None,
@@ -1130,25 +1403,10 @@ async def list_benzinga_consensus_ratings(
     """
     List Benzinga consensus ratings for a ticker.
     """
-    try:
-        results = massive_client.list_benzinga_consensus_ratings(
-            ticker=ticker,
-            date=date,
-            date_gt=date_gt,
-            date_gte=date_gte,
-            date_lt=date_lt,
-            date_lte=date_lte,
-            limit=limit,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_benzinga_earnings, fields=BENZINGA_EARNINGS_FIELDS)
 async def list_benzinga_earnings(
     date: Optional[Union[str, date]] = None,
     date_any_of: Optional[str] = None,
@@ -1211,74 +1469,11 @@ async def list_benzinga_earnings(
     """
     List Benzinga earnings.
     """
-    try:
-        results = massive_client.list_benzinga_earnings(
-            date=date,
-            date_any_of=date_any_of,
-            date_gt=date_gt,
-            date_gte=date_gte,
-            date_lt=date_lt,
-            date_lte=date_lte,
-            ticker=ticker,
-            ticker_any_of=ticker_any_of,
-            ticker_gt=ticker_gt,
-            ticker_gte=ticker_gte,
-            ticker_lt=ticker_lt,
-            ticker_lte=ticker_lte,
-            importance=importance,
-            importance_any_of=importance_any_of,
-            importance_gt=importance_gt,
-            importance_gte=importance_gte,
-            importance_lt=importance_lt,
-            importance_lte=importance_lte,
-            last_updated=last_updated,
-            last_updated_any_of=last_updated_any_of,
-            last_updated_gt=last_updated_gt,
-            last_updated_gte=last_updated_gte,
-            last_updated_lt=last_updated_lt,
-            last_updated_lte=last_updated_lte,
-            date_status=date_status,
-            date_status_any_of=date_status_any_of,
-            date_status_gt=date_status_gt,
-            date_status_gte=date_status_gte,
-            date_status_lt=date_status_lt,
-            date_status_lte=date_status_lte,
-            eps_surprise_percent=eps_surprise_percent,
-            eps_surprise_percent_any_of=eps_surprise_percent_any_of,
-            eps_surprise_percent_gt=eps_surprise_percent_gt,
-            eps_surprise_percent_gte=eps_surprise_percent_gte,
-            eps_surprise_percent_lt=eps_surprise_percent_lt,
-            eps_surprise_percent_lte=eps_surprise_percent_lte,
-            revenue_surprise_percent=revenue_surprise_percent,
-            revenue_surprise_percent_any_of=revenue_surprise_percent_any_of,
-            revenue_surprise_percent_gt=revenue_surprise_percent_gt,
-            revenue_surprise_percent_gte=revenue_surprise_percent_gte,
-            revenue_surprise_percent_lt=revenue_surprise_percent_lt,
-            revenue_surprise_percent_lte=revenue_surprise_percent_lte,
-            fiscal_year=fiscal_year,
-            fiscal_year_any_of=fiscal_year_any_of,
-            fiscal_year_gt=fiscal_year_gt,
-            fiscal_year_gte=fiscal_year_gte,
-            fiscal_year_lt=fiscal_year_lt,
-            fiscal_year_lte=fiscal_year_lte,
-            fiscal_period=fiscal_period,
-            fiscal_period_any_of=fiscal_period_any_of,
-            fiscal_period_gt=fiscal_period_gt,
-            fiscal_period_gte=fiscal_period_gte,
-            fiscal_period_lt=fiscal_period_lt,
-            fiscal_period_lte=fiscal_period_lte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=DIRECTORY_TTL)
+@_massive_tool(massive_client.list_benzinga_firms)
 async def list_benzinga_firms(
     benzinga_id: Optional[str] = None,
     benzinga_id_any_of: Optional[str] = None,
@@ -1293,26 +1488,10 @@ async def list_benzinga_firms(
     """
     List Benzinga firms.
     """
-    try:
-        results = massive_client.list_benzinga_firms(
-            benzinga_id=benzinga_id,
-            benzinga_id_any_of=benzinga_id_any_of,
-            benzinga_id_gt=benzinga_id_gt,
-            benzinga_id_gte=benzinga_id_gte,
-            benzinga_id_lt=benzinga_id_lt,
-            benzinga_id_lte=benzinga_id_lte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_benzinga_guidance, fields=BENZINGA_GUIDANCE_FIELDS)
 async def list_benzinga_guidance(
     date: Optional[Union[str, date]] = None,
     date_any_of: Optional[str] = None,
@@ -1363,62 +1542,12 @@ async def list_benzinga_guidance(
     """
     List Benzinga guidance.
     """
-    try:
-        results = massive_client.list_benzinga_guidance(
-            date=date,
-            date_any_of=date_any_of,
-            date_gt=date_gt,
-            date_gte=date_gte,
-            date_lt=date_lt,
-            date_lte=date_lte,
-            ticker=ticker,
-            ticker_any_of=ticker_any_of,
-            ticker_gt=ticker_gt,
-            ticker_gte=ticker_gte,
-            ticker_lt=ticker_lt,
-            ticker_lte=ticker_lte,
-            positioning=positioning,
-            positioning_any_of=positioning_any_of,
-            positioning_gt=positioning_gt,
-            positioning_gte=positioning_gte,
-            positioning_lt=positioning_lt,
-            positioning_lte=positioning_lte,
-            importance=importance,
-            importance_any_of=importance_any_of,
-            importance_gt=importance_gt,
-            importance_gte=importance_gte,
-            importance_lt=importance_lt,
-            importance_lte=importance_lte,
-            last_updated=last_updated,
-            last_updated_any_of=last_updated_any_of,
-            last_updated_gt=last_updated_gt,
-            last_updated_gte=last_updated_gte,
-            last_updated_lt=last_updated_lt,
-            last_updated_lte=last_updated_lte,
-            fiscal_year=fiscal_year,
-            fiscal_year_any_of=fiscal_year_any_of,
-            fiscal_year_gt=fiscal_year_gt,
-            fiscal_year_gte=fiscal_year_gte,
-            fiscal_year_lt=fiscal_year_lt,
-            fiscal_year_lte=fiscal_year_lte,
-            fiscal_period=fiscal_period,
-            fiscal_period_any_of=fiscal_period_any_of,
-            fiscal_period_gt=fiscal_period_gt,
-            fiscal_period_gte=fiscal_period_gte,
-            fiscal_period_lt=fiscal_period_lt,
-            fiscal_period_lte=fiscal_period_lte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
+# The v2-specific client method calls the /benzinga/v2/news endpoint
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=NEWS_TTL)
+@_massive_tool(massive_client.list_benzinga_news_v2, fields=BENZINGA_NEWS_FIELDS)
 async def list_benzinga_news(
     published: Optional[str] = None,
     channels: Optional[str] = None,
@@ -1451,27 +1580,10 @@ async def list_benzinga_news(
               the sort direction. The sort column defaults to 'published' if not specified. 
               The sort order defaults to 'desc' if not specified.
     """
-    try:
-        # Use the v2-specific method from the massive client library
-        # This calls the /benzinga/v2/news endpoint
-        results = massive_client.list_benzinga_news_v2(
-            published=published,
-            channels=channels,
-            tags=tags,
-            author=author,
-            stocks=stocks,
-            tickers=tickers,
-            limit=limit,
-            sort=sort,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_benzinga_ratings, fields=BENZINGA_RATINGS_FIELDS)
 async def list_benzinga_ratings(
     date: Optional[Union[str, date]] = None,
     date_any_of: Optional[str] = None,
@@ -1534,74 +1646,10 @@ async def list_benzinga_ratings(
     """
     List Benzinga ratings.
     """
-    try:
-        results = massive_client.list_benzinga_ratings(
-            date=date,
-            date_any_of=date_any_of,
-            date_gt=date_gt,
-            date_gte=date_gte,
-            date_lt=date_lt,
-            date_lte=date_lte,
-            ticker=ticker,
-            ticker_any_of=ticker_any_of,
-            ticker_gt=ticker_gt,
-            ticker_gte=ticker_gte,
-            ticker_lt=ticker_lt,
-            ticker_lte=ticker_lte,
-            importance=importance,
-            importance_any_of=importance_any_of,
-            importance_gt=importance_gt,
-            importance_gte=importance_gte,
-            importance_lt=importance_lt,
-            importance_lte=importance_lte,
-            last_updated=last_updated,
-            last_updated_any_of=last_updated_any_of,
-            last_updated_gt=last_updated_gt,
-            last_updated_gte=last_updated_gte,
-            last_updated_lt=last_updated_lt,
-            last_updated_lte=last_updated_lte,
-            rating_action=rating_action,
-            rating_action_any_of=rating_action_any_of,
-            rating_action_gt=rating_action_gt,
-            rating_action_gte=rating_action_gte,
-            rating_action_lt=rating_action_lt,
-            rating_action_lte=rating_action_lte,
-            price_target_action=price_target_action,
-            price_target_action_any_of=price_target_action_any_of,
-            price_target_action_gt=price_target_action_gt,
-            price_target_action_gte=price_target_action_gte,
-            price_target_action_lt=price_target_action_lt,
-            price_target_action_lte=price_target_action_lte,
-            benzinga_id=benzinga_id,
-            benzinga_id_any_of=benzinga_id_any_of,
-            benzinga_id_gt=benzinga_id_gt,
-            benzinga_id_gte=benzinga_id_gte,
-            benzinga_id_lt=benzinga_id_lt,
-            benzinga_id_lte=benzinga_id_lte,
-            benzinga_analyst_id=benzinga_analyst_id,
-            benzinga_analyst_id_any_of=benzinga_analyst_id_any_of,
-            benzinga_analyst_id_gt=benzinga_analyst_id_gt,
-            benzinga_analyst_id_gte=benzinga_analyst_id_gte,
-            benzinga_analyst_id_lt=benzinga_analyst_id_lt,
-            benzinga_analyst_id_lte=benzinga_analyst_id_lte,
-            benzinga_firm_id=benzinga_firm_id,
-            benzinga_firm_id_any_of=benzinga_firm_id_any_of,
-            benzinga_firm_id_gt=benzinga_firm_id_gt,
-            benzinga_firm_id_gte=benzinga_firm_id_gte,
-            benzinga_firm_id_lt=benzinga_firm_id_lt,
-            benzinga_firm_id_lte=benzinga_firm_id_lte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@_massive_tool(massive_client.list_futures_aggregates, fields=FUTURES_AGGS_FIELDS)
 async def list_futures_aggregates(
     ticker: str,
     resolution: str,
@@ -1617,27 +1665,11 @@ async def list_futures_aggregates(
     """
     Get aggregates for a futures contract in a given time range.
     """
-    try:
-        results = massive_client.list_futures_aggregates(
-            ticker=ticker,
-            resolution=resolution,
-            window_start=window_start,
-            window_start_lt=window_start_lt,
-            window_start_lte=window_start_lte,
-            window_start_gt=window_start_gt,
-            window_start_gte=window_start_gte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=DIRECTORY_TTL)
+@_massive_tool(massive_client.list_futures_contracts, fields=FUTURES_CONTRACTS_FIELDS)
 async def list_futures_contracts(
     product_code: Optional[str] = None,
     first_trade_date: Optional[Union[str, date]] = None,
@@ -1652,26 +1684,11 @@ async def list_futures_contracts(
     """
     Get a paginated list of futures contracts.
     """
-    try:
-        results = massive_client.list_futures_contracts(
-            product_code=product_code,
-            first_trade_date=first_trade_date,
-            last_trade_date=last_trade_date,
-            as_of=as_of,
-            active=active,
-            type=type,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=DIRECTORY_TTL)
+@_massive_tool(massive_client.get_futures_contract_details)
 async def get_futures_contract_details(
     ticker: str,
     as_of: Optional[Union[str, date]] = None,
@@ -1680,20 +1697,11 @@ async def get_futures_contract_details(
     """
     Get details for a single futures contract at a specified point in time.
     """
-    try:
-        results = massive_client.get_futures_contract_details(
-            ticker=ticker,
-            as_of=as_of,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=DIRECTORY_TTL)
+@_massive_tool(massive_client.list_futures_products)
 async def list_futures_products(
     name: Optional[str] = None,
     name_search: Optional[str] = None,
@@ -1711,29 +1719,11 @@ async def list_futures_products(
     """
     Get a list of futures products (including combos).
     """
-    try:
-        results = massive_client.list_futures_products(
-            name=name,
-            name_search=name_search,
-            as_of=as_of,
-            trading_venue=trading_venue,
-            sector=sector,
-            sub_sector=sub_sector,
-            asset_class=asset_class,
-            asset_sub_class=asset_sub_class,
-            type=type,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=DIRECTORY_TTL)
+@_massive_tool(massive_client.get_futures_product_details)
 async def get_futures_product_details(
     product_code: str,
     type: Optional[str] = None,
@@ -1743,21 +1733,15 @@ async def get_futures_product_details(
     """
     Get details for a single futures product as it was at a specific day.
     """
-    try:
-        results = massive_client.get_futures_product_details(
-            product_code=product_code,
-            type=type,
-            as_of=as_of,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=_futures_ticks_ttl)
+@_massive_tool(
+    massive_client.list_futures_quotes,
+    fields=FUTURES_QUOTES_FIELDS,
+    pages_param="max_pages",
+)
 async def list_futures_quotes(
     ticker: str,
     timestamp: Optional[str] = None,
@@ -1773,35 +1757,24 @@ async def list_futures_quotes(
     limit: Optional[int] = 10,
     sort: Optional[str] = None,
     params: Optional[Dict[str, Any]] = None,
+    max_pages: int = 1,
 ) -> str:
     """
     Get quotes for a futures contract in a given time range.
+
+    Args:
+        max_pages: Number of pages of up to limit results to fetch, following the
+                   API's next_url, up to 20. Defaults to 1.
     """
-    try:
-        results = massive_client.list_futures_quotes(
-            ticker=ticker,
-            timestamp=timestamp,
-            timestamp_lt=timestamp_lt,
-            timestamp_lte=timestamp_lte,
-            timestamp_gt=timestamp_gt,
-            timestamp_gte=timestamp_gte,
-            session_end_date=session_end_date,
-            session_end_date_lt=session_end_date_lt,
-            session_end_date_lte=session_end_date_lte,
-            session_end_date_gt=session_end_date_gt,
-            session_end_date_gte=session_end_date_gte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=_futures_ticks_ttl)
+@_massive_tool(
+    massive_client.list_futures_trades,
+    fields=FUTURES_TRADES_FIELDS,
+    pages_param="max_pages",
+)
 async def list_futures_trades(
     ticker: str,
     timestamp: Optional[str] = None,
@@ -1817,35 +1790,72 @@ async def list_futures_trades(
     limit: Optional[int] = 10,
     sort: Optional[str] = None,
     params: Optional[Dict[str, Any]] = None,
+    max_pages: int = 1,
 ) -> str:
     """
     Get trades for a futures contract in a given time range.
+
+    Args:
+        max_pages: Number of pages of up to limit results to fetch, following the
+                   API's next_url, up to 20. Defaults to 1.
     """
-    try:
-        results = massive_client.list_futures_trades(
-            ticker=ticker,
-            timestamp=timestamp,
-            timestamp_lt=timestamp_lt,
-            timestamp_lte=timestamp_lte,
-            timestamp_gt=timestamp_gt,
-            timestamp_gte=timestamp_gte,
-            session_end_date=session_end_date,
-            session_end_date_lt=session_end_date_lt,
-            session_end_date_lte=session_end_date_lte,
-            session_end_date_gt=session_end_date_gt,
-            session_end_date_gte=session_end_date_gte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=_futures_ticks_ttl)
+@_massive_fan_out_tool(massive_client.list_futures_quotes, fields=FUTURES_QUOTES_FIELDS)
+async def list_futures_quotes_batch(
+    tickers: List[str],
+    timestamp: Optional[str] = None,
+    timestamp_lt: Optional[str] = None,
+    timestamp_lte: Optional[str] = None,
+    timestamp_gt: Optional[str] = None,
+    timestamp_gte: Optional[str] = None,
+    session_end_date: Optional[str] = None,
+    session_end_date_lt: Optional[str] = None,
+    session_end_date_lte: Optional[str] = None,
+    session_end_date_gt: Optional[str] = None,
+    session_end_date_gte: Optional[str] = None,
+    limit: Optional[int] = 10,
+    sort: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Get quotes for several futures contracts in a given time range, in one call.
+
+    The filters apply to every ticker, and limit is per ticker.
+    """
+
+
+@poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=_futures_ticks_ttl)
+@_massive_fan_out_tool(massive_client.list_futures_trades, fields=FUTURES_TRADES_FIELDS)
+async def list_futures_trades_batch(
+    tickers: List[str],
+    timestamp: Optional[str] = None,
+    timestamp_lt: Optional[str] = None,
+    timestamp_lte: Optional[str] = None,
+    timestamp_gt: Optional[str] = None,
+    timestamp_gte: Optional[str] = None,
+    session_end_date: Optional[str] = None,
+    session_end_date_lt: Optional[str] = None,
+    session_end_date_lte: Optional[str] = None,
+    session_end_date_gt: Optional[str] = None,
+    session_end_date_gte: Optional[str] = None,
+    limit: Optional[int] = 10,
+    sort: Optional[str] = None,
+    params: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Get trades for several futures contracts in a given time range, in one call.
+
+    The filters apply to every ticker, and limit is per ticker.
+    """
+
+
+@poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=REFERENCE_DATA_TTL)
+@_massive_tool(massive_client.list_futures_schedules, fields=FUTURES_SCHEDULES_FIELDS)
 async def list_futures_schedules(
     session_end_date: Optional[str] = None,
     trading_venue: Optional[str] = None,
@@ -1856,22 +1866,14 @@ async def list_futures_schedules(
     """
     Get trading schedules for multiple futures products on a specific date.
     """
-    try:
-        results = massive_client.list_futures_schedules(
-            session_end_date=session_end_date,
-            trading_venue=trading_venue,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=REFERENCE_DATA_TTL)
+@_massive_tool(
+    massive_client.list_futures_schedules_by_product_code,
+    fields=FUTURES_SCHEDULES_FIELDS,
+)
 async def list_futures_schedules_by_product_code(
     product_code: str,
     session_end_date: Optional[str] = None,
@@ -1886,26 +1888,13 @@ async def list_futures_schedules_by_product_code(
     """
     Get schedule data for a single futures product across many trading dates.
     """
-    try:
-        results = massive_client.list_futures_schedules_by_product_code(
-            product_code=product_code,
-            session_end_date=session_end_date,
-            session_end_date_lt=session_end_date_lt,
-            session_end_date_lte=session_end_date_lte,
-            session_end_date_gt=session_end_date_gt,
-            session_end_date_gte=session_end_date_gte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=MARKET_STATUS_TTL)
+@_massive_tool(
+    massive_client.list_futures_market_statuses, fields=FUTURES_MARKET_STATUSES_FIELDS
+)
 async def list_futures_market_statuses(
     product_code_any_of: Optional[str] = None,
     product_code: Optional[str] = None,
@@ -1916,22 +1905,11 @@ async def list_futures_market_statuses(
     """
     Get market statuses for futures products.
     """
-    try:
-        results = massive_client.list_futures_market_statuses(
-            product_code_any_of=product_code_any_of,
-            product_code=product_code,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 @poly_mcp.tool(annotations=ToolAnnotations(readOnlyHint=True))
+@cached_tool(ttl=LIVE_DATA_TTL)
+@_massive_tool(massive_client.get_futures_snapshot, fields=FUTURES_SNAPSHOT_FIELDS)
 async def get_futures_snapshot(
     ticker: Optional[str] = None,
     ticker_any_of: Optional[str] = None,
@@ -1952,29 +1930,6 @@ async def get_futures_snapshot(
     """
     Get snapshots for futures contracts.
     """
-    try:
-        results = massive_client.get_futures_snapshot(
-            ticker=ticker,
-            ticker_any_of=ticker_any_of,
-            ticker_gt=ticker_gt,
-            ticker_gte=ticker_gte,
-            ticker_lt=ticker_lt,
-            ticker_lte=ticker_lte,
-            product_code=product_code,
-            product_code_any_of=product_code_any_of,
-            product_code_gt=product_code_gt,
-            product_code_gte=product_code_gte,
-            product_code_lt=product_code_lt,
-            product_code_lte=product_code_lte,
-            limit=limit,
-            sort=sort,
-            params=params,
-            raw=True,
-        )
-
-        return json_to_csv(results.data.decode("utf-8"))
-    except Exception as e:
-        return f"Error: {e}"
 
 
 # Directly expose the MCP server object
@@ -1986,6 +1941,21 @@ def run(transport: Literal["stdio", "sse", "streamable-http"] = "stdio") -> None
     if transport in ("sse", "streamable-http"):
         host = os.environ.get("HOST", "0.0.0.0")
         port = int(os.environ.get("PORT", "8000"))
+        _use_uvloop()
         poly_mcp.run(transport, host=host, port=port)
     else:
         poly_mcp.run(transport)
+
+
+def _use_uvloop() -> None:
+    """
+    Serve network transports on uvloop when it is installed.
+
+    The HTTP transports handle many concurrent connections on the event loop,
+    where uvloop's faster reactor pays off; stdio serves a single client.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -0,0 +1,250 @@
+import asyncio
+import inspect
+
+from mcp_massive.cache import (
+    MAX_CACHED_RESULT_LENGTH,
+    SharedCalls,
+    TTLCache,
+    cached_tool,
+    tool_cache,
+)
+
+
+class FakeClock:
+    """Manually advanced clock for deterministic expiry tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for the TTLCache class."""
+
+    def test_get_missing_key(self):
+        """Test that a missing key returns None."""
+        cache = TTLCache()
+        assert cache.get("missing") is None
+
+    def test_set_and_get(self):
+        """Test that a stored value is returned before it expires."""
+        clock = FakeClock()
+        cache = TTLCache(clock=clock)
+        cache.set("key", "value", ttl=10)
+
+        clock.now = 9.9
+        assert cache.get("key") == "value"
+
+    def test_entry_expires(self):
+        """Test that entries expire once their TTL has elapsed."""
+        clock = FakeClock()
+        cache = TTLCache(clock=clock)
+        cache.set("key", "value", ttl=10)
+
+        clock.now = 10
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_per_entry_ttl(self):
+        """Test that each entry keeps its own TTL."""
+        clock = FakeClock()
+        cache = TTLCache(clock=clock)
+        cache.set("short", 1, ttl=1)
+        cache.set("long", 2, ttl=100)
+
+        clock.now = 50
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2)
+        cache.set("a", 1, ttl=60)
+        cache.set("b", 2, ttl=60)
+        cache.get("a")
+        cache.set("c", 3, ttl=60)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_clear(self):
+        """Test that clear removes all entries."""
+        cache = TTLCache()
+        cache.set("key", "value", ttl=60)
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestSharedCalls:
+    """Tests for the SharedCalls class."""
+
+    def test_concurrent_calls_share_one_run(self):
+        """Test that concurrent calls with the same key run the call once."""
+        shared = SharedCalls()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return "result"
+
+        async def main():
+            return await asyncio.gather(*(shared.run("key", call) for _ in range(3)))
+
+        assert asyncio.run(main()) == ["result"] * 3
+        assert len(calls) == 1
+        assert len(shared) == 0
+
+    def test_different_keys_run_separately(self):
+        """Test that calls with different keys are not shared."""
+        shared = SharedCalls()
+        calls = []
+
+        async def call(key):
+            calls.append(key)
+            await asyncio.sleep(0)
+            return key
+
+        async def main():
+            return await asyncio.gather(
+                shared.run("a", lambda: call("a")), shared.run("b", lambda: call("b"))
+            )
+
+        assert asyncio.run(main()) == ["a", "b"]
+        assert calls == ["a", "b"]
+
+    def test_completed_calls_are_not_reused(self):
+        """Test that a call after the shared one completed runs again."""
+        shared = SharedCalls()
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return "result"
+
+        async def main():
+            await shared.run("key", call)
+            await shared.run("key", call)
+
+        asyncio.run(main())
+        assert len(calls) == 2
+
+    def test_errors_propagate_to_every_caller(self):
+        """Test that an exception from the shared call reaches all callers."""
+        shared = SharedCalls()
+
+        async def call():
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        async def main():
+            return await asyncio.gather(
+                shared.run("key", call),
+                shared.run("key", call),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(main())
+        assert all(isinstance(result, ValueError) for result in results)
+
+
+class TestCachedTool:
+    """Tests for the cached_tool decorator."""
+
+    def test_repeat_calls_are_cached(self):
+        """Test that equivalent calls only run the tool once."""
+        tool_cache.clear()
+        calls = []
+
+        @cached_tool(ttl=60)
+        async def tool(ticker: str, limit: int = 10) -> str:
+            calls.append((ticker, limit))
+            return f"ticker,limit\n{ticker},{limit}\n"
+
+        first = asyncio.run(tool("AAPL"))
+        second = asyncio.run(tool(ticker="AAPL", limit=10))
+
+        assert first == second
+        assert calls == [("AAPL", 10)]
+
+    def test_different_arguments_are_not_shared(self):
+        """Test that calls with different arguments get separate entries."""
+        tool_cache.clear()
+        calls = []
+
+        @cached_tool(ttl=60)
+        async def tool(ticker: str, params: dict | None = None) -> str:
+            calls.append(ticker)
+            return ticker
+
+        asyncio.run(tool("AAPL", params={"b": 1, "a": 2}))
+        asyncio.run(tool("AAPL", params={"a": 2, "b": 1}))
+        asyncio.run(tool("MSFT"))
+
+        assert calls == ["AAPL", "MSFT"]
+
+    def test_errors_are_not_cached(self):
+        """Test that error results are retried on the next call."""
+        tool_cache.clear()
+        calls = []
+
+        @cached_tool(ttl=60)
+        async def tool() -> str:
+            calls.append(1)
+            return "Error: boom"
+
+        asyncio.run(tool())
+        asyncio.run(tool())
+
+        assert len(calls) == 2
+
+    def test_large_results_are_not_cached(self):
+        """Test that results past MAX_CACHED_RESULT_LENGTH are not kept."""
+        tool_cache.clear()
+        calls = []
+
+        @cached_tool(ttl=60)
+        async def tool(length: int) -> str:
+            calls.append(length)
+            return "x" * length
+
+        for _ in range(2):
+            asyncio.run(tool(MAX_CACHED_RESULT_LENGTH))
+            asyncio.run(tool(MAX_CACHED_RESULT_LENGTH + 1))
+
+        assert calls == [
+            MAX_CACHED_RESULT_LENGTH,
+            MAX_CACHED_RESULT_LENGTH + 1,
+            MAX_CACHED_RESULT_LENGTH + 1,
+        ]
+
+    def test_ttl_from_arguments(self):
+        """Test that a ttl function sets the lifetime from the arguments."""
+        tool_cache.clear()
+        calls = []
+
+        @cached_tool(ttl=lambda arguments: 60 if arguments["ticker"] == "old" else 0)
+        async def tool(ticker: str) -> str:
+            calls.append(ticker)
+            return ticker
+
+        for _ in range(2):
+            asyncio.run(tool("old"))
+            asyncio.run(tool("live"))
+
+        assert calls == ["old", "live", "live"]
+
+    def test_preserves_tool_metadata(self):
+        """Test that the wrapper keeps the name and docstring of the tool."""
+
+        @cached_tool(ttl=60)
+        async def get_exchanges(asset_class: str | None = None) -> str:
+            """List exchanges."""
+            return ""
+
+        assert get_exchanges.__name__ == "get_exchanges"
+        assert get_exchanges.__doc__ == "List exchanges."
+        assert list(inspect.signature(get_exchanges).parameters) == ["asset_class"]
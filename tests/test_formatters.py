@@ -16,6 +16,13 @@ class TestFlattenDict:
         result = _flatten_dict(input_dict)
         assert result == {"a": 1, "b": 2, "c": 3}
 
+    def test_flat_dict_is_copied(self):
+        """Test that flat dictionaries are returned as a new dict."""
+        input_dict = {"a": 1, "b": None}
+        result = _flatten_dict(input_dict)
+        result["c"] = 3
+        assert input_dict == {"a": 1, "b": None}
+
     def test_nested_dict(self):
         """Test flattening nested dictionaries."""
         input_dict = {"outer": {"inner": "value"}}
@@ -193,6 +200,23 @@ class TestJsonToCsvStdlib:
         assert rows[0]["ticker"] == "AAPL"
         assert rows[0]["price"] == "150.5"
 
+    def test_json_bytes_input(self):
+        """Test that raw response bytes are parsed without decoding first."""
+        json_string = '{"results": [{"ticker": "AAPL", "name": "Café"}]}'
+        results = json_to_csv(json_string.encode("utf-8"))
+
+        reader = csv.DictReader(io.StringIO(results))
+        rows = list(reader)
+
+        assert len(rows) == 1
+        assert rows[0]["ticker"] == "AAPL"
+        assert rows[0]["name"] == "Café"
+
+    def test_invalid_json_bytes(self):
+        """Test that invalid JSON bytes return empty CSV gracefully."""
+        assert json_to_csv(b"not valid json {") == ""
+        assert json_to_csv(b"\xff\xfe\xfd") == ""
+
     def test_json_dict_input(self):
         """Test that dict input works directly."""
         json_dict = {"results": [{"ticker": "AAPL", "price": 150.5}]}
@@ -266,6 +290,86 @@ class TestJsonToCsvStdlib:
         assert rows[1]["volume"] == ""
         assert rows[0]["extra_field"] == ""
 
+    def test_single_column(self):
+        """Test that single-column rows are written as one cell per row."""
+        json_input = {"results": [{"ticker": "AAPL"}, {"ticker": "MSFT"}]}
+
+        results = json_to_csv(json_input)
+
+        assert results == "ticker\nAAPL\nMSFT\n"
+
+    def test_full_and_sparse_rows_keep_column_order(self):
+        """Test that complete and sparse rows are both aligned to the header."""
+        json_input = {
+            "results": [
+                {"o": 1, "c": 2, "v": 3},
+                {"v": 6, "o": 4, "c": 5},
+                {"c": 8},
+            ]
+        }
+
+        results = json_to_csv(json_input)
+
+        assert results == "o,c,v\n1,2,3\n4,5,6\n,8,\n"
+
+    def test_field_formats(self):
+        """Test that float values are formatted per field."""
+        json_input = {
+            "results": [
+                {"o": 187.15000000000001, "vw": 0.123456789012345, "t": 1, "x": 0.5},
+                {"o": 190, "vw": None, "t": 2, "x": 1.123456789012345},
+            ]
+        }
+
+        results = json_to_csv(json_input, field_formats={"o": ".4f", "vw": ".6g"})
+        reader = csv.DictReader(io.StringIO(results))
+        rows = list(reader)
+
+        assert rows[0]["o"] == "187.1500"
+        assert rows[0]["vw"] == "0.123457"
+        assert rows[0]["x"] == "0.5"
+        # Integers, nulls and fields without a format are left untouched
+        assert rows[1]["o"] == "190"
+        assert rows[1]["vw"] == ""
+        assert rows[1]["x"] == "1.123456789012345"
+
+    def test_aggs_field_formats_keep_large_volumes(self):
+        """Test that the aggregate formats never round a volume."""
+        from mcp_massive.server import AGGS_FIELD_FORMATS
+
+        json_input = {"results": [{"c": 187.15000000000001, "v": 15983273451.0}]}
+
+        results = json_to_csv(json_input, field_formats=AGGS_FIELD_FORMATS)
+        rows = list(csv.DictReader(io.StringIO(results)))
+
+        assert rows[0]["c"] == "187.15"
+        assert float(rows[0]["v"]) == 15983273451.0
+
+    def test_dict_input_is_not_modified(self):
+        """Test that a dict passed in is left unchanged by formatting."""
+        json_input = {"results": [{"c": 1.23456789012345, "v": 100}]}
+
+        json_to_csv(json_input, field_formats={"c": ".3g"})
+
+        assert json_input == {"results": [{"c": 1.23456789012345, "v": 100}]}
+
+    def test_fields_order(self):
+        """Test that listed fields lead the header in the given order."""
+        json_input = {
+            "results": [
+                {"v": 100, "c": 2.0, "o": 1.0, "extra": "x"},
+                {"v": 200, "c": 3.0, "o": 2.0},
+            ]
+        }
+
+        results = json_to_csv(json_input, fields=("t", "o", "c", "v"))
+        lines = results.strip().split("\n")
+
+        # Missing listed fields are dropped, unlisted fields are appended
+        assert lines[0] == "o,c,v,extra"
+        assert lines[1] == "1.0,2.0,100,x"
+        assert lines[2] == "2.0,3.0,200,"
+
     def test_special_characters_in_values(self):
         """Test handling of special characters in CSV values."""
         json_input = {
@@ -0,0 +1,523 @@
+import asyncio
+import functools
+import inspect
+import json
+import threading
+import time
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+import pytest
+from massive.exceptions import BadResponse
+from urllib3.exceptions import HTTPError
+
+from mcp_massive import server
+from mcp_massive.cache import tool_cache
+
+
+class FakeResponse:
+    """Stand-in for the urllib3 response a raw client request returns."""
+
+    def __init__(self, body, status=200):
+        self.data = json.dumps(body).encode()
+        self.status = status
+
+
+class TestCallBatched:
+    """Tests for the _call_batched helper."""
+
+    def test_merges_batches(self):
+        """Test that batch responses merge into one response with fixed scalars."""
+        calls = []
+
+        def request(tickers, limit):
+            calls.append(tickers)
+            return FakeResponse(
+                {
+                    "results": [{"ticker": ticker} for ticker in tickers][:limit],
+                    "count": min(len(tickers), limit),
+                    "status": "OK",
+                    "request_id": f"request-{len(calls)}",
+                    "next_url": "https://api.massive.com/next",
+                }
+            )
+
+        tickers = [f"T{i}" for i in range(server.TICKER_BATCH_SIZE * 2 + 10)]
+        merged = asyncio.run(
+            server._call_batched(request, {"tickers": tickers, "limit": 300}, "tickers")
+        )
+
+        # Batches are requested concurrently, so they arrive in any order
+        assert sorted(map(len, calls)) == [
+            10,
+            server.TICKER_BATCH_SIZE,
+            server.TICKER_BATCH_SIZE,
+        ]
+        assert [row["ticker"] for row in merged["results"]] == tickers[:300]
+        assert merged["count"] == 300
+        assert merged["status"] == "OK"
+        assert "request_id" not in merged
+        assert "next_url" not in merged
+
+    def test_without_limit(self):
+        """Test that every batch's rows are kept when no limit is given."""
+
+        def request(tickers):
+            return FakeResponse(
+                {"tickers": [{"ticker": ticker} for ticker in tickers], "count": 1}
+            )
+
+        tickers = [f"T{i}" for i in range(server.TICKER_BATCH_SIZE + 1)]
+        merged = asyncio.run(
+            server._call_batched(request, {"tickers": tickers}, "tickers")
+        )
+
+        assert len(merged["tickers"]) == len(tickers)
+        assert merged["count"] == len(tickers)
+
+    def test_batches_get_their_own_params(self, monkeypatch):
+        """Test that batches neither share nor modify the caller's params."""
+        http = FakeHTTP()
+        monkeypatch.setattr(server.massive_client, "client", http)
+        request = functools.partial(server.massive_client.get_snapshot_all, raw=True)
+        tickers = [f"T{i}" for i in range(server.TICKER_BATCH_SIZE + 1)]
+        params = {}
+
+        asyncio.run(
+            server._call_batched(
+                request,
+                {"market_type": "stocks", "tickers": tickers, "params": params},
+                "tickers",
+            )
+        )
+
+        assert params == {}
+        sent = sorted(fields["tickers"] for fields in http.fields)
+        assert sent == sorted([",".join(tickers[:-1]), tickers[-1]])
+
+
+def range_tool(
+    timestamp_gt=None,
+    timestamp_lt=None,
+    date_gte=None,
+    date_lte=None,
+    strike_price_gte=None,
+    strike_price_lt=None,
+    limit=10,
+):
+    """Stub tool declaring range filters for _range_bounds."""
+
+
+class TestRangeBounds:
+    """Tests for the _range_bounds and _empty_range helpers."""
+
+    bounds = server._range_bounds(inspect.signature(range_tool).parameters)
+
+    def empty(self, **arguments):
+        return server._empty_range(arguments, self.bounds)
+
+    def test_pairs_bounds(self):
+        """Test that lower and upper filters of the same field are paired."""
+        assert self.bounds == [
+            ("timestamp_gt", "timestamp_lt", False),
+            ("date_gte", "date_lte", True),
+            ("strike_price_gte", "strike_price_lt", False),
+        ]
+
+    def test_equal_bounds(self):
+        """Test that equal bounds are only empty for an exclusive range."""
+        assert self.empty(timestamp_gt="2024-01-02", timestamp_lt="2024-01-02")
+        assert self.empty(strike_price_gte=100, strike_price_lt=100)
+        assert self.empty(date_gte="2024-01-02", date_lte="2024-01-02") is None
+
+    def test_dates(self):
+        """Test that date objects and date strings are compared."""
+        assert self.empty(date_gte=date(2024, 1, 3), date_lte=date(2024, 1, 2))
+        assert self.empty(date_gte="2024-01-03", date_lte="2024-01-02")
+        assert self.empty(date_gte="2024-01-02", date_lte="2024-01-03") is None
+
+    def test_ints(self):
+        """Test that numeric bounds are compared."""
+        message = self.empty(strike_price_gte=200, strike_price_lt=100)
+        assert message == "strike_price_gte=200 is not below strike_price_lt=100"
+        assert self.empty(strike_price_gte=100, strike_price_lt=200) is None
+
+    def test_timestamps_in_different_offsets_are_skipped(self):
+        """Test that ISO timestamps in different UTC offsets are not compared."""
+        assert (
+            self.empty(
+                timestamp_gt="2024-01-02T10:00:00+05:00",
+                timestamp_lt="2024-01-02T09:00:00Z",
+            )
+            is None
+        )
+        assert self.empty(
+            timestamp_gt="2024-01-02T10:00:00Z",
+            timestamp_lt="2024-01-02T09:00:00Z",
+        )
+
+    def test_mismatched_types_are_skipped(self):
+        """Test that bounds of different types are not compared."""
+        assert self.empty(timestamp_gt="2024-01-02", timestamp_lt=1) is None
+        assert self.empty(date_gte=date(2024, 1, 3), date_lte="2024-01-02") is None
+        assert (
+            self.empty(date_gte=datetime(2024, 1, 3), date_lte=date(2024, 1, 2)) is None
+        )
+
+    def test_aware_and_naive_datetimes_are_skipped(self):
+        """Test that a datetime with an offset is not compared to a naive one."""
+        aware = datetime(2024, 1, 3, tzinfo=timezone.utc)
+        naive = datetime(2024, 1, 2)
+        assert self.empty(timestamp_gt=aware, timestamp_lt=naive) is None
+        assert self.empty(timestamp_gt=aware, timestamp_lt=aware)
+
+
+class TestErrorMessage:
+    """Tests for the _error_message helper."""
+
+    def test_message_field(self):
+        """Test that the message of a JSON error body is returned."""
+        error = BadResponse('{"status": "ERROR", "message": "Unknown ticker."}')
+        assert server._error_message(error) == "Unknown ticker."
+
+    def test_error_field(self):
+        """Test that the error field is used when there is no message."""
+        error = BadResponse('{"status": "ERROR", "error": "Not authorized."}')
+        assert server._error_message(error) == "Not authorized."
+
+    def test_non_json_body(self):
+        """Test that a body that is not JSON is returned as is."""
+        error = BadResponse("<html>Bad Gateway</html>")
+        assert server._error_message(error) == "<html>Bad Gateway</html>"
+
+    def test_other_errors(self):
+        """Test that other errors are described by their string."""
+        assert server._error_message(TimeoutError("timed out")) == "timed out"
+
+
+def utc(*args):
+    """Return the epoch time of a UTC datetime."""
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+class TestFuturesTicksTTL:
+    """Tests for the _is_settled and _futures_ticks_ttl helpers."""
+
+    @pytest.fixture(autouse=True)
+    def clock(self, monkeypatch):
+        """Fix the current time at 2024-01-03T02:00:00Z."""
+        monkeypatch.setattr(time, "time", lambda: utc(2024, 1, 3, 2))
+
+    def test_epoch_timestamps(self):
+        """Test that epoch timestamps from seconds to nanoseconds are read."""
+        settled = int(utc(2024, 1, 3, 0, 59))
+        recent = int(utc(2024, 1, 3, 1, 30))
+        for scale in (1, 1_000, 1_000_000, 1_000_000_000):
+            assert server._is_settled(str(settled * scale))
+            assert not server._is_settled(str(recent * scale))
+
+    def test_dates_cover_the_whole_day(self, monkeypatch):
+        """Test that a date is only settled an hour after the day ends."""
+        assert server._is_settled("2024-01-02")
+        monkeypatch.setattr(time, "time", lambda: utc(2024, 1, 3, 0, 30))
+        assert not server._is_settled("2024-01-02")
+
+    def test_iso_timestamps(self):
+        """Test that ISO timestamps with a Z suffix or an offset are read."""
+        assert server._is_settled("2024-01-03T00:59:00Z")
+        assert not server._is_settled("2024-01-03T01:30:00Z")
+        assert server._is_settled("2024-01-03T05:59:00+05:00")
+        assert not server._is_settled("2024-01-03T06:30:00+05:00")
+
+    def test_naive_timestamps_are_utc(self):
+        """Test that a timestamp without an offset is read as UTC."""
+        assert server._is_settled("2024-01-03T00:59:00")
+        assert not server._is_settled("2024-01-03T01:30:00")
+
+    def test_unparseable_values(self):
+        """Test that values that are not times are never settled."""
+        assert not server._is_settled("yesterday")
+
+    def test_ttl(self):
+        """Test that only queries bounded by a settled time are kept long."""
+        ttl = server._futures_ticks_ttl
+        assert ttl({"timestamp_lt": "2024-01-02"}) == server.HISTORICAL_DATA_TTL
+        assert ttl({"session_end_date": "2024-01-02"}) == server.HISTORICAL_DATA_TTL
+        assert ttl({"timestamp_lt": "2024-01-03"}) == server.LIVE_DATA_TTL
+        assert ttl({"timestamp_gte": "2024-01-02"}) == server.LIVE_DATA_TTL
+        assert ttl({}) == server.LIVE_DATA_TTL
+
+
+class FakeHTTP:
+    """Stand-in for the client's urllib3 pool, recording the requests made."""
+
+    def __init__(self, pages=None):
+        self.pages = pages or {}
+        self.urls = []
+        self.fields = []
+        self.requested = threading.Event()
+
+    def request(self, method, url, fields=None, headers=None):
+        self.urls.append(url)
+        self.fields.append(fields)
+        self.requested.set()
+        return self.pages.get(url) or page([])
+
+
+def page(rows, next_url=None):
+    """Return a list response with the given rows and next_url."""
+    return FakeResponse({"results": rows, "next_url": next_url, "status": "OK"})
+
+
+def cursor(n, host="https://api.massive.com"):
+    """Return the URL of page n of a paginated list request."""
+    return f"{host}/v3/trades/ESZ5?cursor={n}"
+
+
+class TestIterPages:
+    """Tests for the _iter_pages and _next_page helpers."""
+
+    @pytest.fixture
+    def http(self, monkeypatch):
+        # next_url names another host, which must not receive the request
+        http = FakeHTTP(
+            {
+                cursor(2): page([{"n": 2}], cursor(3, "https://other.example")),
+                cursor(3): page([{"n": 3}], cursor(4, "https://other.example")),
+                cursor(4): page([{"n": 4}]),
+            }
+        )
+        monkeypatch.setattr(server.massive_client, "client", http)
+        return http
+
+    @staticmethod
+    def request(**arguments):
+        return page([{"n": 1}], cursor(2, "https://other.example"))
+
+    def pages(self, max_pages):
+        async def collect():
+            return [
+                rows async for rows in server._iter_pages(self.request, {}, max_pages)
+            ]
+
+        return asyncio.run(collect())
+
+    def test_follows_next_url(self, http):
+        """Test that pages are followed until there is no next_url."""
+        assert self.pages(10) == [[{"n": 1}], [{"n": 2}], [{"n": 3}], [{"n": 4}]]
+        assert http.urls == [cursor(2), cursor(3), cursor(4)]
+
+    def test_next_url_uses_client_base(self, http, monkeypatch):
+        """Test that only the path and query of next_url are kept."""
+        monkeypatch.setattr(server.massive_client, "BASE", "https://proxy.local")
+
+        self.pages(2)
+
+        assert http.urls == [cursor(2, "https://proxy.local")]
+
+    def test_stops_at_max_pages(self, http):
+        """Test that no page past max_pages is requested."""
+        assert self.pages(2) == [[{"n": 1}], [{"n": 2}]]
+        assert http.urls == [cursor(2)]
+
+    def test_prefetches_next_page(self, http):
+        """Test that the next page is requested before the current one is used."""
+
+        async def first_page():
+            async for rows in server._iter_pages(self.request, {}, 2):
+                # The event loop is blocked here, so only a request started
+                # before this page was yielded can set the event
+                return rows, http.requested.wait(timeout=5)
+
+        assert asyncio.run(first_page()) == ([{"n": 1}], True)
+        assert http.urls == [cursor(2)]
+
+    def test_error_on_later_page(self, http):
+        """Test that a non-200 next_url response raises BadResponse."""
+        http.pages[cursor(3)] = FakeResponse({"status": "ERROR"}, status=500)
+
+        with pytest.raises(BadResponse, match="ERROR"):
+            self.pages(10)
+
+
+class TestRejectedRequests:
+    """Tests for the negative cache of requests the API rejected."""
+
+    @pytest.fixture(autouse=True)
+    def clear_error_cache(self):
+        server.error_cache.clear()
+
+    @staticmethod
+    def tool(error):
+        calls = []
+
+        def method(ticker, limit=None, params=None, raw=False):
+            calls.append(ticker)
+            raise error
+
+        @server._massive_tool(method)
+        async def lookup(ticker: str, limit: Optional[int] = 10) -> str:
+            """Stub tool forwarding to method."""
+
+        return lookup, calls
+
+    def test_rejected_call_is_not_repeated(self):
+        """Test that a call the API rejected is answered without a request."""
+        lookup, calls = self.tool(BadResponse('{"message": "Unknown ticker."}'))
+
+        assert asyncio.run(lookup("XYZ")) == "Error: Unknown ticker."
+        assert asyncio.run(lookup("XYZ")) == "Error: Unknown ticker."
+        assert calls == ["XYZ"]
+
+        asyncio.run(lookup("ABC"))
+        assert calls == ["XYZ", "ABC"]
+
+    def test_network_errors_are_not_cached(self):
+        """Test that a call failing with an HTTPError is retried."""
+        lookup, calls = self.tool(HTTPError("connection reset"))
+
+        assert asyncio.run(lookup("XYZ")) == "Error: connection reset"
+        asyncio.run(lookup("XYZ"))
+        assert calls == ["XYZ", "XYZ"]
+
+
+class TestFanOutTool:
+    """Tests for tools made with _massive_fan_out_tool."""
+
+    @pytest.fixture(autouse=True)
+    def clear_error_cache(self):
+        server.error_cache.clear()
+
+    @staticmethod
+    def tool(responses):
+        calls = []
+
+        def method(ticker, timestamp_gt=None, timestamp_lt=None, limit=None, raw=False):
+            calls.append(ticker)
+            response = responses[ticker]
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        @server._massive_fan_out_tool(method, fields=("ticker", "price"))
+        async def lookup(
+            tickers: List[str],
+            timestamp_gt: Optional[str] = None,
+            timestamp_lt: Optional[str] = None,
+            limit: Optional[int] = 10,
+        ) -> str:
+            """Stub tool fanning out to method."""
+
+        return lookup, calls
+
+    def test_rows_of_all_tickers(self):
+        """Test that rows are merged and tagged with their ticker."""
+        lookup, calls = self.tool(
+            {
+                "ESZ5": page([{"price": 1.5}, {"price": 2.5}]),
+                "NQZ5": page([{"price": 3.5, "ticker": "NQZ5"}]),
+            }
+        )
+
+        result = asyncio.run(lookup(["ESZ5", "NQZ5", "ESZ5"]))
+
+        assert result.splitlines() == [
+            "ticker,price",
+            "ESZ5,1.5",
+            "ESZ5,2.5",
+            "NQZ5,3.5",
+        ]
+        assert sorted(calls) == ["ESZ5", "NQZ5"]
+
+    def test_failed_ticker_keeps_other_rows(self):
+        """Test that each failed ticker is reported alongside the others' rows."""
+        lookup, calls = self.tool(
+            {
+                "ESZ5": page([{"price": 1.5}]),
+                "BAD": BadResponse('{"message": "Unknown ticker."}'),
+                "NQZ5": HTTPError("connection reset"),
+            }
+        )
+
+        result = asyncio.run(lookup(["ESZ5", "BAD", "NQZ5"]))
+
+        assert result.splitlines() == [
+            "Error: BAD: Unknown ticker.",
+            "Error: NQZ5: connection reset",
+            "ticker,price",
+            "ESZ5,1.5",
+        ]
+
+    def test_rejected_ticker_is_not_requested_again(self):
+        """Test that only the rejected ticker is answered from the error cache."""
+        lookup, calls = self.tool(
+            {
+                "ESZ5": page([{"price": 1.5}]),
+                "BAD": BadResponse('{"message": "Unknown ticker."}'),
+            }
+        )
+
+        asyncio.run(lookup(["ESZ5", "BAD"]))
+        result = asyncio.run(lookup(["ESZ5", "BAD"]))
+
+        assert result.startswith("Error: BAD: Unknown ticker.\n")
+        assert sorted(calls) == ["BAD", "ESZ5", "ESZ5"]
+
+    def test_calls_without_rows_are_not_made(self):
+        """Test that limit=0 and empty ranges return without a request."""
+        lookup, calls = self.tool({})
+
+        assert asyncio.run(lookup(["ESZ5"], limit=0)) == ""
+        result = asyncio.run(
+            lookup(["ESZ5"], timestamp_gt="2024-01-02", timestamp_lt="2024-01-01")
+        )
+        assert result.startswith("Error: empty range")
+        assert calls == []
+
+    def test_bugs_propagate(self):
+        """Test that errors other than request errors are raised."""
+        lookup, calls = self.tool({"ESZ5": page([{"price": 1.5}])})
+
+        with pytest.raises(KeyError):
+            asyncio.run(lookup(["ESZ5", "UNKNOWN"]))
+
+
+class TestToolQueries:
+    """Tests for the query the client sends for a tool call."""
+
+    @pytest.fixture
+    def http(self, monkeypatch):
+        tool_cache.clear()
+        server.error_cache.clear()
+        http = FakeHTTP()
+        monkeypatch.setattr(server.massive_client, "client", http)
+        return http
+
+    def test_any_of_filters_are_split(self, http):
+        """Test that a comma-separated *_any_of string is sent as one list."""
+        asyncio.run(
+            server.poly_mcp.call_tool(
+                "list_treasury_yields", {"date_any_of": "2024-01-02,2024-01-03"}
+            )
+        )
+
+        assert http.fields[0]["date.any_of"] == "2024-01-02,2024-01-03"
+
+    def test_params_none_values_are_dropped(self, http):
+        """Test that None params are not sent and the caller's dict is kept."""
+        params = {"timespan": None, "extra": "value"}
+
+        asyncio.run(server.list_treasury_yields(params=params))
+
+        assert http.fields[0]["extra"] == "value"
+        assert "timespan" not in http.fields[0]
+        assert params == {"timespan": None, "extra": "value"}
+
+    def test_empty_params_are_not_modified(self, http):
+        """Test that the client's query is not written into the caller's dict."""
+        params = {}
+
+        asyncio.run(server.list_treasury_yields(params=params))
+
+        assert http.fields[0]["limit"] == 10
+        assert params == {}